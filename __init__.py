@@ -15,83 +15,113 @@ Typical usage:
     llm = llm_manager.get_llm()
 """
 
+import importlib
+import os
+
 from .config.settings import Settings, settings
 from .config.logging_config import logger, setup_logger
 
-from .llm.llm_manager import (
-    LLMManager,
-    DefaultModelConfigRepository,
-    SettingsAPIKeyProvider,
-    ModelProviderFactory,
-    UseCaseConfig,
-    LLMCache,
-    LLMManagerRegistry,
-)
-
-from .session.session_manager import Session, SessionManager
-from .dependencies.application_container import ApplicationContainer
-
-from .memory.memory_config import MemoryConfig, MemoryConfigFactory, MemoryStrategy
-from .memory.memory_manager import MemoryManager, InMemoryMemoryManager
-
-from .agents.agent import Agent, AgentConfig
-from .agents.agent_factory import DefaultAgentFactory
-from .agents.agent_registry import AgentRegistry
-
-from .tools.tool_registry import ToolRegistry
-from .tools.builtin import BuiltinToolRegistry
-
-from .storage.storage_backend import StorageBackend
-from .storage.in_memory import InMemoryStorage
-
-from .validation.validators import (
-    ChatRequest,
-    AgentCreateRequest,
-    SessionCreateRequest,
-    validate_chat_request,
-)
-
-from .observability.metrics import MetricsCollector, InMemoryMetricsCollector
-from .observability.tracing import TraceContext, get_trace_context
-
-from .lifecycle.lifecycle_manager import LifecycleManager
-
-from .plugins.plugin_registry import Plugin, PluginRegistry
-
-from .exceptions import (
-    GenAICoreException,
-    SessionError,
-    SessionNotFoundError,
-    SessionExpiredError,
-    SessionLimitExceededError,
-    LLMError,
-    LLMProviderError,
-    ModelNotFoundError,
-    APIKeyError,
-    MemoryError,
-    MemoryStrategyError,
-    AgentError,
-    AgentNotFoundError,
-    AgentInitializationError,
-    ToolError,
-    ToolNotFoundError,
-    ToolExecutionError,
-    StorageError,
-    StorageBackendError,
-    ConfigurationError,
-    ValidationError,
-)
-
-from .utils.token_counter import TokenCounter, TokenCount, get_token_counter
-from .utils.token_counting_wrapper import (
-    TokenCountingObserver,
-    TokenCountingWrapper,
-    ChatEvent,
-    should_enable_token_counting,
-    collect_token_data,
-    update_token_data_with_result,
-    process_token_counting,
-)
+# Public names resolved on first attribute access (PEP 562), keyed by the
+# submodule that defines them. Only settings and logging are imported eagerly
+# so that ``import gen_ai_core_lib`` does not pull in langchain, pydantic, etc.
+_LAZY_IMPORTS = {
+    ".llm.llm_manager": (
+        "LLMManager",
+        "DefaultModelConfigRepository",
+        "SettingsAPIKeyProvider",
+        "ModelProviderFactory",
+        "UseCaseConfig",
+        "LLMCache",
+        "LLMManagerRegistry",
+    ),
+    ".session.session_manager": ("Session", "SessionManager"),
+    ".dependencies.application_container": ("ApplicationContainer",),
+    ".memory.memory_config": ("MemoryConfig", "MemoryConfigFactory", "MemoryStrategy"),
+    ".memory.memory_manager": ("MemoryManager", "InMemoryMemoryManager"),
+    ".memory.redis_memory_manager": ("RedisMemoryManager",),
+    ".agents.agent": ("Agent", "AgentConfig"),
+    ".agents.agent_factory": ("DefaultAgentFactory",),
+    ".agents.agent_registry": ("AgentRegistry",),
+    ".agents.agent_pool": ("AgentPool",),
+    ".tools.tool_registry": ("ToolRegistry",),
+    ".tools.builtin": ("BuiltinToolRegistry",),
+    ".storage.storage_backend": ("StorageBackend",),
+    ".storage.in_memory": ("InMemoryStorage",),
+    ".validation.validators": (
+        "ChatRequest",
+        "AgentCreateRequest",
+        "SessionCreateRequest",
+        "validate_chat_request",
+    ),
+    ".observability.metrics": ("MetricsCollector", "InMemoryMetricsCollector"),
+    ".observability.prom_metrics": ("PrometheusMetricsCollector",),
+    ".observability.tracing": ("TraceContext", "get_trace_context"),
+    ".lifecycle.lifecycle_manager": ("LifecycleManager",),
+    ".plugins.plugin_registry": ("Plugin", "PluginRegistry"),
+    ".exceptions": (
+        "GenAICoreException",
+        "SessionError",
+        "SessionNotFoundError",
+        "SessionExpiredError",
+        "SessionLimitExceededError",
+        "LLMError",
+        "LLMProviderError",
+        "ModelNotFoundError",
+        "APIKeyError",
+        "MemoryError",
+        "MemoryStrategyError",
+        "AgentError",
+        "AgentNotFoundError",
+        "AgentInitializationError",
+        "ToolError",
+        "ToolNotFoundError",
+        "ToolExecutionError",
+        "StorageError",
+        "StorageBackendError",
+        "ConfigurationError",
+        "ValidationError",
+    ),
+    ".utils.token_counter": ("TokenCounter", "TokenCount", "get_token_counter"),
+    ".utils.token_counting_wrapper": (
+        "TokenCountingObserver",
+        "TokenCountingWrapper",
+        "ChatEvent",
+        "should_enable_token_counting",
+        "collect_token_data",
+        "update_token_data_with_result",
+        "process_token_counting",
+    ),
+}
+
+_lazy_map = {
+    name: module
+    for module, names in _LAZY_IMPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    try:
+        module_name = _lazy_map[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache in module globals so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_map))
+
+
+# Escape hatch for servers that prefer paying the import cost at startup
+# rather than on the first request.
+if os.getenv("GEN_AI_CORE_EAGER_IMPORT", "").lower() in ("true", "1", "yes", "on"):
+    for _name in _lazy_map:
+        __getattr__(_name)
+    del _name
 
 __all__ = [
     # Config / logging
@@ -118,11 +148,13 @@ __all__ = [
     "MemoryStrategy",
     "MemoryManager",
     "InMemoryMemoryManager",
+    "RedisMemoryManager",
     # Agents
     "Agent",
     "AgentConfig",
     "DefaultAgentFactory",
     "AgentRegistry",
+    "AgentPool",
     # Tools
     "ToolRegistry",
     "BuiltinToolRegistry",
@@ -137,6 +169,7 @@ __all__ = [
     # Observability
     "MetricsCollector",
     "InMemoryMetricsCollector",
+    "PrometheusMetricsCollector",
     "TraceContext",
     "get_trace_context",
     # Lifecycle
@@ -0,0 +1,9 @@
+"""
+Compatibility helpers for the supported Python versions.
+"""
+import sys
+
+
+# dataclass(slots=True) is only available on Python 3.10+;
+# use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
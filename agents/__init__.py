@@ -5,10 +5,17 @@ Agent abstractions for chatbots and AI agents.
 from .agent import Agent, AgentConfig
 from .agent_factory import AgentFactory
 from .agent_registry import AgentRegistry
+from .agent_pool import AgentPool, PooledAgent
+from .cache import AgentResponseCache, ExactMatchCache, SemanticCache
 
 __all__ = [
     "Agent",
     "AgentConfig",
     "AgentFactory",
     "AgentRegistry",
+    "AgentPool",
+    "PooledAgent",
+    "AgentResponseCache",
+    "ExactMatchCache",
+    "SemanticCache",
 ]
@@ -1,18 +1,25 @@
 """
 Agent interface and configuration for chatbots and AI agents.
 """
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from __future__ import annotations
 
-from langchain_core.messages import BaseMessage
-from langchain_core.language_models import BaseChatModel
+import copy
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
+from dataclasses import dataclass, field
 
+from .._compat import DATACLASS_SLOTS
 from ..memory.memory_config import MemoryConfig
 from ..exceptions import AgentError
 
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from .cache import AgentResponseCache
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AgentConfig:
     """Configuration for an agent."""
     agent_id: str
@@ -21,15 +28,9 @@ class AgentConfig:
     model_name: Optional[str] = None
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
-    tools: List[str] = None  # List of tool names
+    tools: List[str] = field(default_factory=list)  # List of tool names
     memory_config: Optional[MemoryConfig] = None
-    metadata: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.tools is None:
-            self.tools = []
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class Agent(ABC):
@@ -40,16 +41,27 @@ class Agent(ABC):
     Agents handle user input, manage conversation context, and produce responses.
     """
     
-    def __init__(self, config: AgentConfig, llm: BaseChatModel):
+    def __init__(
+        self,
+        config: AgentConfig,
+        llm: BaseChatModel,
+        response_cache: Optional[AgentResponseCache] = None
+    ):
         """
         Initialize agent.
         
         Args:
             config: Agent configuration
             llm: Language model instance
+            response_cache: Optional cache used by invoke_cached()
         """
         self.config = config
         self.llm = llm
+        self.response_cache = response_cache
+        # Plain attributes for hot paths (logging, tracing, metrics tags)
+        self.agent_id = config.agent_id
+        self.agent_type = config.agent_type
+        self.memory_config = config.memory_config
     
     @abstractmethod
     async def invoke(
@@ -79,6 +91,53 @@ class Agent(ABC):
         """
         pass
     
+    async def invoke_cached(
+        self,
+        input: str | Dict[str, Any],
+        session_id: str,
+        config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Like invoke(), but serve repeated prompts from the response cache.
+        
+        Falls back to invoke() when no response cache is configured, and when
+        the agent has a ``memory_config``: its answers depend on the session's
+        conversation, and a cache hit would skip updating that memory.
+        
+        Cached responses are shared across sessions of the same agent id and
+        system prompt. The cache keeps its own deep copy of each response and
+        every caller gets a fresh deep copy, so editing a returned response
+        (including nested ``metadata``) never affects other callers. The
+        returned ``session_id`` is always the caller's.
+        
+        Args:
+            input: User input (string or structured dict)
+            session_id: Session identifier for conversation context
+            config: Optional runtime configuration
+            
+        Returns:
+            Response dictionary (see invoke())
+        """
+        cache = self.response_cache
+        if cache is None or self.memory_config is not None:
+            return await self.invoke(input, session_id, config)
+        
+        scope = hashlib.blake2b(
+            f"{self.agent_id}|{self.config.system_prompt}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        prompt = input if isinstance(input, str) else json.dumps(input, sort_keys=True, default=str)
+        
+        cached = cache.get(scope, prompt)
+        if cached is not None:
+            response = copy.deepcopy(cached)
+            response["session_id"] = session_id
+            return response
+        
+        result = await self.invoke(input, session_id, config)
+        cache.put(scope, prompt, copy.deepcopy(result))
+        return result
+    
     @abstractmethod
     def get_tools(self) -> List[Any]:
         """
@@ -89,19 +148,30 @@ class Agent(ABC):
         """
         pass
     
+    def reset(self) -> None:
+        """
+        Reset per-conversation state so the agent can be reused.
+        
+        Called by AgentPool before an agent is returned to the pool.
+        The default implementation is a no-op.
+        """
+        pass
+    
     def get_memory_config(self) -> Optional[MemoryConfig]:
         """
         Get memory configuration for this agent.
         
+        Prefer the ``memory_config`` attribute; kept for backward compatibility.
+        
         Returns:
             MemoryConfig if configured, None otherwise
         """
-        return self.config.memory_config
+        return self.memory_config
     
     def get_agent_id(self) -> str:
-        """Get agent identifier."""
-        return self.config.agent_id
+        """Get agent identifier (prefer the ``agent_id`` attribute)."""
+        return self.agent_id
     
     def get_agent_type(self) -> str:
-        """Get agent type."""
-        return self.config.agent_type
+        """Get agent type (prefer the ``agent_type`` attribute)."""
+        return self.agent_type
@@ -1,15 +1,20 @@
 """
 Factory for creating agent instances.
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable
+from __future__ import annotations
 
-from langchain_core.language_models import BaseChatModel
+import sys
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Optional, Callable, Mapping
 
 from .agent import Agent, AgentConfig
-from ..exceptions import AgentInitializationError, AgentNotFoundError
+from ..exceptions import AgentError, AgentInitializationError, AgentNotFoundError
 from ..config.logging_config import logger
 
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
 
 class AgentFactory(ABC):
     """
@@ -46,10 +51,16 @@ class DefaultAgentFactory(AgentFactory):
     """
     Default implementation of agent factory.
     Registers agent types and creates instances.
+    
+    Agent types are registered at startup; call freeze() once registration is
+    done to make the set of builders read-only while serving requests.
     """
     
     def __init__(self):
-        self._agent_builders: Dict[str, Callable[[AgentConfig, Optional[BaseChatModel]], Agent]] = {}
+        self._agent_builders: Mapping[str, Callable[[AgentConfig, Optional[BaseChatModel]], Agent]] = {}
+        # Pre-bound lookup for create_agent; rebound when the mapping is replaced
+        self._lookup = self._agent_builders.__getitem__
+        self._frozen = False
     
     def register_agent_type(
         self,
@@ -62,9 +73,37 @@ class DefaultAgentFactory(AgentFactory):
         Args:
             agent_type: Agent type identifier
             builder: Callable that takes (config: AgentConfig, llm: BaseChatModel) -> Agent
+            
+        Raises:
+            AgentError: If the factory has been frozen
         """
+        if self._frozen:
+            raise AgentError(
+                f"Cannot register agent type '{agent_type}': agent factory is frozen"
+            )
+        # Agent types are a small, fixed set; interning lets lookups with the
+        # same string hit the identity fast path in dict comparisons
+        agent_type = sys.intern(agent_type)
         self._agent_builders[agent_type] = builder
-        logger.info(f"Registered agent type: {agent_type}")
+        logger.info("Registered agent type: %s", agent_type)
+    
+    def freeze(self) -> None:
+        """
+        Make the registered agent types read-only.
+        
+        Call once all agent types are registered (e.g. from a lifecycle
+        startup hook). Further register_agent_type() calls raise AgentError.
+        """
+        if not self._frozen:
+            self._agent_builders = MappingProxyType(dict(self._agent_builders))
+            self._lookup = self._agent_builders.__getitem__
+            self._frozen = True
+            logger.info("Agent factory frozen with %d agent types", len(self._agent_builders))
+    
+    @property
+    def is_frozen(self) -> bool:
+        """Check if the factory has been frozen."""
+        return self._frozen
     
     def create_agent(
         self,
@@ -87,26 +126,30 @@ class DefaultAgentFactory(AgentFactory):
             AgentNotFoundError: If agent type is not registered
             AgentInitializationError: If agent creation fails
         """
-        if agent_type not in self._agent_builders:
+        try:
+            builder = self._lookup(agent_type)
+        except KeyError:
             available = ", ".join(self._agent_builders.keys())
             raise AgentNotFoundError(
                 f"Agent type '{agent_type}' is not registered. "
                 f"Available types: {available}"
-            )
+            ) from None
         
         try:
-            # Convert config dict to AgentConfig if needed
-            if isinstance(config, dict):
+            # Convert config dict to AgentConfig if needed (exact type check
+            # first: it is the common case and skips the MRO walk)
+            if type(config) is AgentConfig:
+                agent_config = config
+            elif isinstance(config, dict):
                 agent_config = AgentConfig(**config)
             else:
                 agent_config = config
             
-            builder = self._agent_builders[agent_type]
             agent = builder(agent_config, llm)
-            logger.info(f"Created agent: {agent_config.agent_id} (type: {agent_type})")
+            logger.info("Created agent: %s (type: %s)", agent_config.agent_id, agent_type)
             return agent
         except Exception as e:
-            logger.error(f"Failed to create agent {agent_type}: {e}", exc_info=True)
+            logger.error("Failed to create agent %s: %s", agent_type, e, exc_info=True)
             raise AgentInitializationError(
                 f"Failed to create agent '{agent_type}': {str(e)}"
             ) from e
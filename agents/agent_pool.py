@@ -0,0 +1,140 @@
+"""
+Pool of reusable agent instances.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import astuple
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple, Union
+from threading import Lock
+
+from .agent import Agent, AgentConfig
+from .agent_factory import AgentFactory
+from ..config.logging_config import logger
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+
+PoolKey = Tuple[Any, ...]
+
+
+class PooledAgent:
+    """
+    Agent checked out from an AgentPool.
+    Use as a context manager (or call release()) to hand the agent back.
+    """
+
+    def __init__(self, pool: AgentPool, key: PoolKey, agent: Agent):
+        self._pool = pool
+        self._key = key
+        self._released = False
+        self.agent = agent
+
+    def release(self) -> None:
+        """Return the agent to the pool (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self._key, self.agent)
+
+    def __enter__(self) -> Agent:
+        return self.agent
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class AgentPool:
+    """
+    Pool of idle agents, keyed by the parts of the configuration that
+    determine agent behaviour.
+
+    An idle agent is only handed out for a config with the same agent id,
+    type, model settings, prompt, tools and memory config, and for the same
+    ``llm`` object (or again none, meaning the factory default). Thread-safe.
+    """
+
+    def __init__(self, factory: AgentFactory, max_per_key: int = 8):
+        """
+        Initialize agent pool.
+
+        Args:
+            factory: Factory used to create agents when no idle one is available
+            max_per_key: Maximum number of idle agents kept per key
+        """
+        self._factory = factory
+        self._max_per_key = max_per_key
+        self._idle: Dict[PoolKey, Deque[Agent]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _make_key(agent_type: str, config: AgentConfig, llm: Optional[BaseChatModel]) -> PoolKey:
+        return (
+            agent_type,
+            config.agent_id,
+            config.model_name,
+            config.temperature,
+            config.max_tokens,
+            tuple(sorted(config.tools or ())),
+            config.system_prompt,
+            astuple(config.memory_config) if config.memory_config is not None else None,
+            # Idle agents hold their llm, so its id cannot be reused while keyed here
+            id(llm) if llm is not None else None,
+        )
+
+    def acquire(
+        self,
+        agent_type: str,
+        config: Union[AgentConfig, Dict[str, Any]],
+        llm: Optional[BaseChatModel] = None
+    ) -> PooledAgent:
+        """
+        Check out an agent, creating one if no idle agent matches.
+
+        Args:
+            agent_type: Type of agent to create
+            config: Agent configuration (AgentConfig or dictionary)
+            llm: Optional LLM instance; only agents created with this same instance are reused
+
+        Returns:
+            PooledAgent wrapping the agent
+
+        Raises:
+            AgentNotFoundError: If agent type is not registered
+            AgentInitializationError: If agent creation fails
+        """
+        agent_config = config if isinstance(config, AgentConfig) else AgentConfig(**config)
+        key = self._make_key(agent_type, agent_config, llm)
+
+        with self._lock:
+            idle = self._idle.get(key)
+            agent = idle.pop() if idle else None
+
+        if agent is None:
+            agent = self._factory.create_agent(agent_type, agent_config, llm)
+
+        return PooledAgent(self, key, agent)
+
+    def _release(self, key: PoolKey, agent: Agent) -> None:
+        """Reset an agent and keep it for reuse if there is room."""
+        try:
+            agent.reset()
+        except Exception as e:
+            logger.warning("Discarding agent %s after failed reset: %s", agent.agent_id, e)
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self._max_per_key:
+                idle.append(agent)
+
+    def idle_count(self) -> int:
+        """Get total number of idle agents in the pool."""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def clear(self) -> None:
+        """Drop all idle agents."""
+        with self._lock:
+            self._idle.clear()
+            logger.info("Cleared agent pool")
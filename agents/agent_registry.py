@@ -1,6 +1,7 @@
 """
 Registry for managing agent instances.
 """
+import sys
 from typing import Dict, Optional
 from threading import Lock
 
@@ -13,12 +14,21 @@ class AgentRegistry:
     """
     Registry for managing agent instances.
     Provides thread-safe access to registered agents.
+    
+    Writes are copy-on-write: they build a new dict under the lock and rebind
+    ``_agents``, so reads never need the lock.
     """
     
     def __init__(self):
         self._agents: Dict[str, Agent] = {}
+        self._lookup = self._agents.__getitem__
         self._lock = Lock()
     
+    def _publish(self, agents: Dict[str, Agent]) -> None:
+        """Swap in a new agents dict (caller holds the lock)."""
+        self._agents = agents
+        self._lookup = agents.__getitem__
+    
     def register(self, agent_id: str, agent: Agent) -> None:
         """
         Register an agent instance.
@@ -27,9 +37,14 @@ class AgentRegistry:
             agent_id: Unique agent identifier
             agent: Agent instance
         """
+        # Agent ids are long-lived keys; interning them speeds up later lookups
+        # with equal strings. Only do this for bounded sets of ids.
+        agent_id = sys.intern(agent_id)
         with self._lock:
-            self._agents[agent_id] = agent
-            logger.info(f"Registered agent: {agent_id}")
+            agents = dict(self._agents)
+            agents[agent_id] = agent
+            self._publish(agents)
+            logger.info("Registered agent: %s", agent_id)
     
     def get(self, agent_id: str) -> Agent:
         """
@@ -44,14 +59,13 @@ class AgentRegistry:
         Raises:
             AgentNotFoundError: If agent is not found
         """
-        with self._lock:
-            if agent_id not in self._agents:
-                available = list(self._agents.keys())
-                raise AgentNotFoundError(
-                    f"Agent '{agent_id}' not found. "
-                    f"Available agents: {available}"
-                )
-            return self._agents[agent_id]
+        try:
+            return self._lookup(agent_id)
+        except KeyError:
+            raise AgentNotFoundError(
+                f"Agent '{agent_id}' not found. "
+                f"Available agents: {list(self._agents)}"
+            ) from None
     
     def unregister(self, agent_id: str) -> bool:
         """
@@ -65,8 +79,10 @@ class AgentRegistry:
         """
         with self._lock:
             if agent_id in self._agents:
-                del self._agents[agent_id]
-                logger.info(f"Unregistered agent: {agent_id}")
+                agents = dict(self._agents)
+                del agents[agent_id]
+                self._publish(agents)
+                logger.info("Unregistered agent: %s", agent_id)
                 return True
             return False
     
@@ -77,11 +93,10 @@ class AgentRegistry:
         Returns:
             List of agent IDs
         """
-        with self._lock:
-            return list(self._agents.keys())
+        return list(self._agents)
     
     def clear(self) -> None:
         """Clear all registered agents."""
         with self._lock:
-            self._agents.clear()
+            self._publish({})
             logger.info("Cleared agent registry")
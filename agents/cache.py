@@ -0,0 +1,167 @@
+"""
+Response caches for agents.
+
+Caches are keyed by a *scope* (identifies the agent and its system prompt)
+and the user *prompt*, so one cache instance can be shared between agents.
+Caches store values as given; ``Agent.invoke_cached`` only ever puts and
+hands out deep copies, so cached responses are never edited in place.
+"""
+from collections import OrderedDict
+from math import sqrt
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+from threading import Lock
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class AgentResponseCache(Protocol):
+    """Protocol for agent response caches."""
+
+    def get(self, scope: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """Get cached response for a prompt, or None on a miss."""
+        ...
+
+    def put(self, scope: str, prompt: str, value: Dict[str, Any]) -> None:
+        """Cache the response for a prompt."""
+        ...
+
+
+class ExactMatchCache:
+    """
+    LRU cache that only hits on identical prompts.
+    Thread-safe implementation.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize exact-match cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+        """
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, scope: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """Get cached response (thread-safe)."""
+        key = (scope, prompt)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, scope: str, prompt: str, value: Dict[str, Any]) -> None:
+        """Cache a response, evicting the least recently used one if full (thread-safe)."""
+        key = (scope, prompt)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the cache (thread-safe)."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticCache:
+    """
+    Cache that hits on prompts whose embeddings are close to a cached one.
+
+    Prompts are embedded with a caller-supplied function (for example
+    ``OpenAIEmbeddings().embed_query``) and compared by cosine similarity
+    against the entries cached for the same scope. When numpy is installed
+    the comparison is a single matrix-vector product over a contiguous
+    float32 matrix per scope; otherwise it falls back to pure Python.
+    Thread-safe implementation.
+    """
+
+    def __init__(
+        self,
+        embedder: Callable[[str], Sequence[float]],
+        threshold: float = 0.95,
+        max_entries_per_scope: int = 1024,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embedder: Callable mapping a prompt to its embedding vector
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries_per_scope: Maximum cached responses per scope (oldest evicted first)
+        """
+        self._embedder = embedder
+        self._threshold = threshold
+        self._max_entries = max_entries_per_scope
+        self._entries: Dict[str, List[Tuple[List[float], Dict[str, Any]]]] = {}
+        # scope -> (embedding matrix, values), rebuilt lazily after writes
+        self._matrices: Dict[str, Tuple[Any, List[Dict[str, Any]]]] = {}
+        self._lock = Lock()
+
+    def _embed(self, prompt: str) -> List[float]:
+        """Embed a prompt and normalize it to unit length."""
+        vector = [float(x) for x in self._embedder(prompt)]
+        norm = sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def _matrix(self, scope: str) -> Optional[Tuple[Any, List[Dict[str, Any]]]]:
+        """Get the (matrix, values) snapshot for a scope. Caller must hold the lock."""
+        cached = self._matrices.get(scope)
+        if cached is None:
+            entries = self._entries.get(scope)
+            if not entries:
+                return None
+            matrix = np.array([vector for vector, _ in entries], dtype=np.float32)
+            cached = self._matrices[scope] = (matrix, [value for _, value in entries])
+        return cached
+
+    def get(self, scope: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """Get the response cached for the most similar prompt above the threshold."""
+        if NUMPY_AVAILABLE:
+            with self._lock:
+                snapshot = self._matrix(scope)
+            if snapshot is None:
+                return None
+
+            matrix, values = snapshot
+            scores = matrix @ np.asarray(self._embed(prompt), dtype=np.float32)
+            best = int(scores.argmax())
+            return values[best] if scores[best] >= self._threshold else None
+
+        with self._lock:
+            entries = list(self._entries.get(scope, ()))
+        if not entries:
+            return None
+
+        query = self._embed(prompt)
+        best_score = self._threshold
+        best_value = None
+        for vector, value in entries:
+            score = sum(a * b for a, b in zip(query, vector))
+            if score >= best_score:
+                best_score = score
+                best_value = value
+        return best_value
+
+    def put(self, scope: str, prompt: str, value: Dict[str, Any]) -> None:
+        """Cache a response for a prompt."""
+        vector = self._embed(prompt)
+        with self._lock:
+            entries = self._entries.setdefault(scope, [])
+            entries.append((vector, value))
+            if len(entries) > self._max_entries:
+                del entries[0]
+            self._matrices.pop(scope, None)
+
+    def clear(self) -> None:
+        """Clear the cache (thread-safe)."""
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
@@ -4,8 +4,10 @@ LLM-specific configuration.
 from dataclasses import dataclass
 from typing import Optional
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class LLMConfig:
     """Configuration for LLM models."""
     model: str
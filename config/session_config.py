@@ -4,8 +4,10 @@ Session-specific configuration.
 from dataclasses import dataclass
 from typing import Optional
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SessionConfig:
     """Configuration for session management."""
     timeout_hours: int = 24
@@ -98,6 +98,15 @@ class Settings:
     # If your API key is org-scoped, set this to your workspace ID
     # If not org-scoped, leave it empty
     LANGSMITH_WORKSPACE_ID: str = os.getenv("LANGSMITH_WORKSPACE_ID", "")
+    
+    # Fraction of new traces whose spans are recorded (1.0 = all, 0.0 = none)
+    TRACE_SAMPLE_RATE: float = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+    
+    # Load tiktoken encodings when utils.token_counter is imported instead of on first use
+    PREWARM_TIKTOKEN: bool = os.getenv("GEN_AI_PREWARM_TIKTOKEN", "false").lower() == "true"
+    
+    # Number of memoized token counts kept per process (0 disables the memo)
+    TOKEN_COUNT_CACHE_SIZE: int = int(os.getenv("TOKEN_COUNT_CACHE_SIZE", "4096"))
 
 
 # Create singleton settings instance
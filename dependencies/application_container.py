@@ -9,52 +9,73 @@ lazy initialization and are created only when requested.
 This ensures core functionality is always available while keeping optional
 features lazy-loaded for better performance.
 """
-from typing import Optional, Callable, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Callable, Any
 from datetime import timedelta
-from functools import wraps
+from enum import IntFlag, auto
+from functools import cached_property, lru_cache
+import logging
 import threading
 
 from ..llm.llm_manager import (
     LLMManager,
     DefaultModelConfigRepository,
-    SettingsAPIKeyProvider,
     ModelProviderFactory,
     UseCaseConfig,
     LLMCache,
     LLMManagerRegistry,
+    default_api_key_provider,
 )
 from ..session.session_manager import SessionManager
 from ..memory.memory_manager import MemoryManager, InMemoryMemoryManager
 from ..agents.agent_factory import DefaultAgentFactory
-from ..agents.agent_registry import AgentRegistry
-from ..tools.tool_registry import ToolRegistry
-from ..observability.metrics import MetricsCollector, InMemoryMetricsCollector
-from ..lifecycle.lifecycle_manager import LifecycleManager
-from ..plugins.plugin_registry import PluginRegistry
 from ..config.settings import settings
 from ..config.logging_config import logger
 
+# Optional services are imported inside their lazy properties so that
+# importing the container does not load modules that may never be used.
+if TYPE_CHECKING:
+    from ..agents.agent_registry import AgentRegistry
+    from ..agents.agent_pool import AgentPool
+    from ..tools.tool_registry import ToolRegistry
+    from ..observability.metrics import MetricsCollector
+    from ..lifecycle.lifecycle_manager import LifecycleManager
+    from ..plugins.plugin_registry import PluginRegistry
+
+
+@lru_cache(maxsize=1)
+def _session_timeout(hours: int) -> timedelta:
+    """Session timeout for the configured hours, reused across containers."""
+    return timedelta(hours=hours)
+
+
+class _NullLock:
+    """No-op stand-in for threading.Lock used by single-threaded containers."""
+
+    def __enter__(self) -> "_NullLock":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+_NULL_LOCK = _NullLock()
 
-def _lazy_property(initializer: Callable[[], Any]) -> property:
-    """
-    Create a lazy-initialized property that is thread-safe.
-    The initializer is called once on first access.
-    """
-    attr_name = f"_{initializer.__name__}"
-    
-    @property
-    @wraps(initializer)
-    def prop(self):
-        if not hasattr(self, attr_name) or getattr(self, attr_name) is None:
-            with self._lock:
-                # Double-check after acquiring lock
-                if not hasattr(self, attr_name) or getattr(self, attr_name) is None:
-                    value = initializer(self)
-                    setattr(self, attr_name, value)
-                    logger.debug(f"{initializer.__name__} initialized on first access")
-        return getattr(self, attr_name)
-    
-    return prop
+
+class ContainerService(IntFlag):
+    """Services managed by ApplicationContainer, used to track which are initialized."""
+    LLM_REGISTRY = auto()
+    LLM_MANAGER = auto()
+    SESSION_MANAGER = auto()
+    MEMORY_MANAGER = auto()
+    AGENT_FACTORY = auto()
+    AGENT_REGISTRY = auto()
+    AGENT_POOL = auto()
+    TOOL_REGISTRY = auto()
+    PLUGIN_REGISTRY = auto()
+    LIFECYCLE_MANAGER = auto()
+    METRICS_COLLECTOR = auto()
 
 
 class ApplicationContainer:
@@ -68,10 +89,18 @@ class ApplicationContainer:
     features lazy-loaded.
     """
 
-    def __init__(self):
-        self._lock = threading.Lock()
+    def __init__(self, *, thread_safe: bool = True):
+        """
+        Initialize the container and its core dependencies.
+
+        Args:
+            thread_safe: Guard lazy initialization with a lock. Pass False only
+                when the container is used from a single thread (scripts,
+                single-worker apps) to skip the locking entirely.
+        """
+        self._lock = threading.Lock() if thread_safe else _NULL_LOCK
         # Track what has been initialized
-        self._initialized_services = set()
+        self._initialized = ContainerService(0)
         
         # Initialize core mandatory dependencies immediately
         self._initialize_core_dependencies()
@@ -80,83 +109,99 @@ class ApplicationContainer:
         """Initialize core mandatory dependencies immediately."""
         # Initialize LLM registry first (required for LLM manager)
         self._llm_registry = LLMManagerRegistry()
-        self._initialized_services.add("llm_registry")
+        self._initialized |= ContainerService.LLM_REGISTRY
         logger.info("LLM registry initialized (mandatory)")
         
         # Initialize LLM manager (mandatory)
         self._llm_manager = self._llm_registry.create_and_register(
             instance_id="default",
             config_repository=DefaultModelConfigRepository(),
-            api_key_provider=SettingsAPIKeyProvider(),
+            api_key_provider=default_api_key_provider,
             provider_factory=ModelProviderFactory(),
             use_case_config=UseCaseConfig(),
             cache=LLMCache(),
         )
-        self._initialized_services.add("llm_manager")
+        self._initialized |= ContainerService.LLM_MANAGER
         logger.info("LLM manager initialized (mandatory)")
         
         # Initialize session manager (mandatory)
         self._session_manager = SessionManager(
-            session_timeout=timedelta(hours=settings.SESSION_TIMEOUT_HOURS),
+            session_timeout=_session_timeout(settings.SESSION_TIMEOUT_HOURS),
             max_sessions=settings.MAX_CONCURRENT_SESSIONS,
         )
-        self._initialized_services.add("session_manager")
+        self._initialized |= ContainerService.SESSION_MANAGER
         logger.info("Session manager initialized (mandatory)")
         
         # Initialize memory manager (mandatory)
         self._memory_manager = InMemoryMemoryManager()
-        self._initialized_services.add("memory_manager")
+        self._initialized |= ContainerService.MEMORY_MANAGER
         logger.info("Memory manager initialized (mandatory)")
         
         # Initialize agent factory (mandatory)
         self._agent_factory = DefaultAgentFactory()
-        self._initialized_services.add("agent_factory")
+        self._initialized |= ContainerService.AGENT_FACTORY
         logger.info("Agent factory initialized (mandatory)")
         
         logger.info("Core dependencies initialized")
 
+    def _initialize_optional(self, name: str, factory: Callable[[], Any], label: str) -> Any:
+        """
+        Create an optional dependency exactly once.
+
+        Called from the cached properties below. The value is stored in
+        ``__dict__`` under the lock so concurrent first accesses share one
+        instance; afterwards ``cached_property`` serves it without locking.
+        """
+        with self._lock:
+            value = self.__dict__.get(name)
+            if value is None:
+                value = self.__dict__[name] = factory()
+                self._initialized |= ContainerService[name.upper()]
+                logger.info("%s initialized", label)
+            return value
+
     # Lazy-initialized properties for optional registries
-    @_lazy_property
-    def _agent_registry(self) -> AgentRegistry:
-        """Initialize agent registry on first access."""
-        registry = AgentRegistry()
-        self._initialized_services.add("agent_registry")
-        logger.info("Agent registry initialized")
-        return registry
-
-    @_lazy_property
-    def _tool_registry(self) -> ToolRegistry:
-        """Initialize tool registry on first access."""
-        registry = ToolRegistry()
-        self._initialized_services.add("tool_registry")
-        logger.info("Tool registry initialized")
-        return registry
-
-    @_lazy_property
-    def _plugin_registry(self) -> PluginRegistry:
-        """Initialize plugin registry on first access."""
-        registry = PluginRegistry()
-        self._initialized_services.add("plugin_registry")
-        logger.info("Plugin registry initialized")
-        return registry
-
-    @_lazy_property
-    def _lifecycle_manager(self) -> LifecycleManager:
-        """Initialize lifecycle manager on first access."""
-        manager = LifecycleManager()
-        self._initialized_services.add("lifecycle_manager")
-        logger.info("Lifecycle manager initialized")
-        return manager
+    @cached_property
+    def agent_registry(self) -> AgentRegistry:
+        """Agent registry, initialized on first access."""
+        from ..agents.agent_registry import AgentRegistry
+        return self._initialize_optional("agent_registry", AgentRegistry, "Agent registry")
+
+    @cached_property
+    def agent_pool(self) -> AgentPool:
+        """Agent pool backed by the agent factory, initialized on first access."""
+        from ..agents.agent_pool import AgentPool
+        return self._initialize_optional(
+            "agent_pool",
+            lambda: AgentPool(self._agent_factory, max_per_key=settings.AGENT_POOL_SIZE),
+            "Agent pool",
+        )
+
+    @cached_property
+    def tool_registry(self) -> ToolRegistry:
+        """Tool registry, initialized on first access."""
+        from ..tools.tool_registry import ToolRegistry
+        return self._initialize_optional("tool_registry", ToolRegistry, "Tool registry")
+
+    @cached_property
+    def plugin_registry(self) -> PluginRegistry:
+        """Plugin registry, initialized on first access."""
+        from ..plugins.plugin_registry import PluginRegistry
+        return self._initialize_optional("plugin_registry", PluginRegistry, "Plugin registry")
+
+    @cached_property
+    def lifecycle_manager(self) -> LifecycleManager:
+        """Lifecycle manager, initialized on first access."""
+        from ..lifecycle.lifecycle_manager import LifecycleManager
+        return self._initialize_optional("lifecycle_manager", LifecycleManager, "Lifecycle manager")
 
     # Core dependencies are already initialized in __init__, no lazy properties needed
 
-    @_lazy_property
-    def _metrics_collector(self) -> MetricsCollector:
-        """Initialize metrics collector on first access."""
-        collector = InMemoryMetricsCollector()
-        self._initialized_services.add("metrics_collector")
-        logger.info("Metrics collector initialized")
-        return collector
+    @cached_property
+    def metrics_collector(self) -> MetricsCollector:
+        """Metrics collector, initialized on first access."""
+        from ..observability.metrics import InMemoryMetricsCollector
+        return self._initialize_optional("metrics_collector", InMemoryMetricsCollector, "Metrics collector")
 
     # Public getter methods (maintain same interface)
     def get_llm_manager(self) -> LLMManager:
@@ -181,32 +226,40 @@ class ApplicationContainer:
 
     def get_agent_registry(self) -> AgentRegistry:
         """Get the agent registry (lazy-initialized)."""
-        return self._agent_registry
+        return self.agent_registry
+
+    def get_agent_pool(self) -> AgentPool:
+        """Get the agent pool (lazy-initialized)."""
+        return self.agent_pool
 
     def get_tool_registry(self) -> ToolRegistry:
         """Get the tool registry (lazy-initialized)."""
-        return self._tool_registry
+        return self.tool_registry
 
     def get_metrics_collector(self) -> MetricsCollector:
         """Get the metrics collector (lazy-initialized)."""
-        return self._metrics_collector
+        return self.metrics_collector
 
     def get_lifecycle_manager(self) -> LifecycleManager:
         """Get the lifecycle manager (lazy-initialized)."""
-        return self._lifecycle_manager
+        return self.lifecycle_manager
 
     def get_plugin_registry(self) -> PluginRegistry:
         """Get the plugin registry (lazy-initialized)."""
-        return self._plugin_registry
+        return self.plugin_registry
 
     @property
     def is_initialized(self) -> bool:
         """Check if core services have been initialized (always True after __init__)."""
-        return len(self._initialized_services) > 0
+        return bool(self._initialized)
 
     def get_initialized_services(self) -> set[str]:
         """Get set of initialized service names."""
-        return self._initialized_services.copy()
+        return {
+            service.name.lower()
+            for service in ContainerService
+            if service in self._initialized
+        }
 
     def initialize(self) -> None:
         """
@@ -218,11 +271,13 @@ class ApplicationContainer:
         """
         # Touch optional properties to trigger initialization
         _ = (
-            self._metrics_collector,
-            self._agent_registry,
-            self._tool_registry,
-            self._plugin_registry,
-            self._lifecycle_manager,
+            self.metrics_collector,
+            self.agent_registry,
+            self.agent_pool,
+            self.tool_registry,
+            self.plugin_registry,
+            self.lifecycle_manager,
         )
-        logger.info(f"All optional services pre-initialized: {self._initialized_services}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("All optional services pre-initialized: %s", self.get_initialized_services())
 
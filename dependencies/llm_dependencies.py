@@ -26,12 +26,15 @@ def get_container(request: Request) -> ApplicationContainer:
         ):
             llm_manager = container.get_llm_manager()
     """
-    if not hasattr(request.app.state, 'container'):
+    # Single lookup: app.state raises AttributeError on a miss, so hasattr()
+    # followed by attribute access would resolve the attribute twice
+    container = getattr(request.app.state, 'container', None)
+    if container is None:
         raise RuntimeError(
             "Application container not found in app state. "
             "Ensure container is initialized in lifespan startup."
         )
-    return request.app.state.container
+    return container
 
 
 def get_llm_manager(container: Annotated[ApplicationContainer, Depends(get_container)]) -> LLMManager:
@@ -4,42 +4,42 @@ Session Management Dependencies for FastAPI
 Provides dependency injection for session management to reduce boilerplate.
 These helpers are optional and only required when using FastAPI.
 """
-from typing import Optional
+from typing import Awaitable, Callable, Optional
+from contextvars import ContextVar
 from datetime import timedelta
-from threading import Lock
+from functools import lru_cache
 
-from fastapi import Depends, HTTPException, Header, Cookie
+from fastapi import Depends, HTTPException, Header, Cookie, Request, Response
+from fastapi.responses import JSONResponse
 
 from ..config.logging_config import logger
 from ..config.settings import settings
 from ..session.session_manager import Session, SessionManager
 
 
-# Global session manager singleton
-_session_manager: Optional[SessionManager] = None
-_session_manager_lock = Lock()
+# Session resolved by session_middleware for the current request
+_current_session: ContextVar[Optional[Session]] = ContextVar("current_session", default=None)
 
 
+@lru_cache(maxsize=1)
 def get_session_manager() -> SessionManager:
     """
     Get or create the global session manager singleton.
-    Thread-safe double-checked locking pattern.
+    
+    The manager is created when this module is imported (the import lock
+    serializes that first call), so request-time calls are a plain cache hit
+    with no locking. Tests can call ``get_session_manager.cache_clear()`` to
+    get a fresh manager.
     
     Returns:
         SessionManager instance
     """
-    global _session_manager
-    if _session_manager is None:
-        with _session_manager_lock:
-            # Double-check after acquiring lock
-            if _session_manager is None:
-                _session_manager = SessionManager(
-                    session_timeout=timedelta(hours=settings.SESSION_TIMEOUT_HOURS),
-                    max_sessions=settings.MAX_CONCURRENT_SESSIONS
-                )
-                logger.info("Session manager initialized")
-    
-    return _session_manager
+    manager = SessionManager(
+        session_timeout=timedelta(hours=settings.SESSION_TIMEOUT_HOURS),
+        max_sessions=settings.MAX_CONCURRENT_SESSIONS
+    )
+    logger.info("Session manager initialized")
+    return manager
 
 
 def get_or_create_session(
@@ -127,16 +127,15 @@ def get_session_from_path(session_id: str) -> Session:
     Raises:
         HTTPException: 404 if session not found
     """
-    session_manager = get_session_manager()
-    session = session_manager.get_session(session_id)
-    
-    if not session:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Session {session_id} not found"
-        )
+    session = get_session_manager().get_session(session_id)
+    if session is not None:
+        return session
     
-    return session
+    # Only the miss path builds an exception
+    raise HTTPException(
+        status_code=404,
+        detail="Session " + session_id + " not found"
+    )
 
 
 def get_session_from_headers(
@@ -188,6 +187,9 @@ def get_session_from_headers(
     2. user_id cookie (fallback)
     3. None if neither provided
     
+    If session_middleware is installed, the session it already resolved for
+    this request is returned directly.
+    
     Args:
         x_session_id: Session ID from X-Session-ID header
         x_user_id: User ID from X-User-ID header
@@ -200,6 +202,10 @@ def get_session_from_headers(
     Raises:
         HTTPException: If session creation fails
     """
+    session = _current_session.get()
+    if session is not None:
+        return session
+    
     # Prefer headers over cookies
     final_session_id = x_session_id or session_id
     final_user_id = x_user_id or user_id
@@ -210,6 +216,76 @@ def get_session_from_headers(
     )
 
 
+async def session_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """
+    HTTP middleware that resolves the request's session once.
+    
+    Reads the session from the X-Session-ID/X-User-ID headers or the
+    session_id/user_id cookies (headers first), gets or creates it, and
+    makes it available through current_session() for the rest of the
+    request. Every request passing through gets a session, so only install
+    it on apps whose routes use sessions.
+    
+    Usage:
+        app.middleware("http")(session_middleware)
+        
+        @router.post("/chat")
+        async def chat(request: ChatRequest, session: Session = Depends(current_session)):
+            ...
+    
+    Args:
+        request: Incoming request
+        call_next: Next handler in the middleware chain
+    
+    Returns:
+        Response from the route, or a 500 response if session creation fails
+    """
+    headers = request.headers
+    cookies = request.cookies
+    try:
+        session = get_session_manager().get_or_create_session(
+            session_id=headers.get("x-session-id") or cookies.get("session_id"),
+            user_id=headers.get("x-user-id") or cookies.get("user_id")
+        )
+    except RuntimeError as e:
+        logger.error("Failed to get or create session: %s", e, exc_info=True)
+        return JSONResponse(
+            status_code=500,
+            content={"detail": f"Session management error: {str(e)}"}
+        )
+    
+    token = _current_session.set(session)
+    try:
+        return await call_next(request)
+    finally:
+        _current_session.reset(token)
+
+
+async def current_session() -> Session:
+    """
+    FastAPI dependency returning the session resolved by session_middleware.
+    
+    Declared async so FastAPI calls it on the event loop instead of
+    dispatching it to the threadpool.
+    
+    Returns:
+        Session instance for the current request
+    
+    Raises:
+        HTTPException: If session_middleware is not installed
+    """
+    session = _current_session.get()
+    if session is None:
+        raise HTTPException(
+            status_code=500,
+            detail="No session for this request; install session_middleware"
+        )
+    return session
+
+
 def get_session_manager_dependency() -> SessionManager:
     """
     FastAPI dependency that returns the session manager.
@@ -226,3 +302,6 @@ def get_session_manager_dependency() -> SessionManager:
     """
     return get_session_manager()
 
+
+# Create the singleton at import time so concurrent first requests share it
+get_session_manager()
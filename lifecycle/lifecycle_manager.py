@@ -1,11 +1,15 @@
 """
 Lifecycle management for application startup and shutdown.
 """
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 from threading import Lock
+import inspect
 
 from ..config.logging_config import logger
-from ..exceptions import GenAICoreException
+from ..exceptions import GenAICoreException, ValidationError
+
+# (hook, name, is_coroutine_function)
+_Hook = Tuple[Callable, str, bool]
 
 
 class LifecycleManager:
@@ -15,11 +19,18 @@ class LifecycleManager:
     """
     
     def __init__(self):
-        self._startup_hooks: List[Callable] = []
-        self._shutdown_hooks: List[Callable] = []
+        self._startup_hooks: List[_Hook] = []
+        self._shutdown_hooks: List[_Hook] = []
         self._lock = Lock()
         self._started = False
     
+    @staticmethod
+    def _make_hook(hook: Callable, name: Optional[str]) -> _Hook:
+        """Validate a hook and precompute whether it must be awaited."""
+        if not callable(hook):
+            raise ValidationError(f"Lifecycle hook must be callable, got {type(hook).__name__}")
+        return hook, name or getattr(hook, "__name__", repr(hook)), inspect.iscoroutinefunction(hook)
+    
     def add_startup_hook(self, hook: Callable, name: Optional[str] = None) -> None:
         """
         Register startup hook.
@@ -27,10 +38,14 @@ class LifecycleManager:
         Args:
             hook: Callable to execute on startup (can be async or sync)
             name: Optional name for logging
+        
+        Raises:
+            ValidationError: If hook is not callable
         """
+        entry = self._make_hook(hook, name)
         with self._lock:
-            self._startup_hooks.append((hook, name or hook.__name__))
-            logger.debug(f"Registered startup hook: {name or hook.__name__}")
+            self._startup_hooks.append(entry)
+            logger.debug(f"Registered startup hook: {entry[1]}")
     
     def add_shutdown_hook(self, hook: Callable, name: Optional[str] = None) -> None:
         """
@@ -39,10 +54,14 @@ class LifecycleManager:
         Args:
             hook: Callable to execute on shutdown (can be async or sync)
             name: Optional name for logging
+        
+        Raises:
+            ValidationError: If hook is not callable
         """
+        entry = self._make_hook(hook, name)
         with self._lock:
-            self._shutdown_hooks.append((hook, name or hook.__name__))
-            logger.debug(f"Registered shutdown hook: {name or hook.__name__}")
+            self._shutdown_hooks.append(entry)
+            logger.debug(f"Registered shutdown hook: {entry[1]}")
     
     async def startup(self) -> None:
         """
@@ -59,17 +78,13 @@ class LifecycleManager:
         
         logger.info(f"Starting application ({len(hooks)} startup hooks)")
         
-        for hook, name in hooks:
+        for hook, name, is_coro in hooks:
             try:
                 logger.debug(f"Executing startup hook: {name}")
-                if callable(hook):
-                    # Check if it's async
-                    import asyncio
-                    import inspect
-                    if inspect.iscoroutinefunction(hook):
-                        await hook()
-                    else:
-                        hook()
+                if is_coro:
+                    await hook()
+                else:
+                    hook()
                 logger.debug(f"Completed startup hook: {name}")
             except Exception as e:
                 logger.error(f"Startup hook '{name}' failed: {e}", exc_info=True)
@@ -96,16 +111,13 @@ class LifecycleManager:
         
         logger.info(f"Shutting down application ({len(hooks)} shutdown hooks)")
         
-        for hook, name in hooks:
+        for hook, name, is_coro in hooks:
             try:
                 logger.debug(f"Executing shutdown hook: {name}")
-                if callable(hook):
-                    import asyncio
-                    import inspect
-                    if inspect.iscoroutinefunction(hook):
-                        await hook()
-                    else:
-                        hook()
+                if is_coro:
+                    await hook()
+                else:
+                    hook()
                 logger.debug(f"Completed shutdown hook: {name}")
             except Exception as e:
                 logger.error(f"Shutdown hook '{name}' failed: {e}", exc_info=True)
@@ -12,7 +12,8 @@ and uses package-relative imports (no ``sys.path`` hacks or project-specific
 ``src.*`` prefixes).
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, Protocol
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Protocol
 from threading import Lock
 
 from langchain_core.language_models import BaseChatModel
@@ -63,7 +64,7 @@ class APIKeyProvider(Protocol):
 class ModelConfigRepository(Protocol):
     """Protocol for model configuration repositories"""
     
-    def get_config(self, model_name: str) -> Dict[str, Any]:
+    def get_config(self, model_name: str) -> Mapping[str, Any]:
         """Get configuration for a model"""
         ...
     
@@ -80,6 +81,171 @@ class ModelConfigRepository(Protocol):
 # Model Configuration Repository - Single Responsibility
 # ============================================================================
 
+# Built-in model configurations, built once at import and shared by every
+# DefaultModelConfigRepository. Models registered at runtime only go into the
+# registering repository's own copy; the shared entries are read-only views.
+_DEFAULT_MODEL_CONFIGS: Dict[str, Mapping[str, Any]] = {
+    "gpt-4": {
+        "provider": "openai",
+        "model_name": "gpt-4",
+        "class": ChatOpenAI,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+    },
+    "gpt-4-turbo": {
+        "provider": "openai",
+        "model_name": "gpt-4-turbo-preview",
+        "class": ChatOpenAI,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+    },
+    "gpt-4o": {
+        "provider": "openai",
+        "model_name": "gpt-4o",
+        "class": ChatOpenAI,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+    },
+    "gpt-3.5-turbo": {
+        "provider": "openai",
+        "model_name": "gpt-3.5-turbo",
+        "class": ChatOpenAI,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+    },
+    "gpt-3.5-turbo-16k": {
+        "provider": "openai",
+        "model_name": "gpt-3.5-turbo-16k",
+        "class": ChatOpenAI,
+        "default_temperature": 0.7,
+        "default_max_tokens": 4000,  # Higher max tokens for 16k context window
+    },
+    "claude-3-opus": {
+        "provider": "anthropic",
+        "model_name": "claude-3-opus-20240229",
+        "class": ChatAnthropic if ANTHROPIC_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-anthropic",
+    },
+    "claude-3-sonnet": {
+        "provider": "anthropic",
+        "model_name": "claude-3-sonnet-20240229",
+        "class": ChatAnthropic if ANTHROPIC_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-anthropic",
+    },
+    "claude-3-haiku": {
+        "provider": "anthropic",
+        "model_name": "claude-3-haiku-20240307",
+        "class": ChatAnthropic if ANTHROPIC_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-anthropic",
+    },
+    "llama2": {
+        "provider": "ollama",
+        "model_name": "llama2",
+        "class": ChatOllama if OLLAMA_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-ollama",
+    },
+    "llama3": {
+        "provider": "ollama",
+        "model_name": "llama3",
+        "class": ChatOllama if OLLAMA_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-ollama",
+    },
+    "llama3.1": {
+        "provider": "ollama",
+        "model_name": "llama3.1",
+        "class": ChatOllama if OLLAMA_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-ollama",
+    },
+    "llama3.2": {
+        "provider": "ollama",
+        "model_name": "llama3.2",
+        "class": ChatOllama if OLLAMA_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-ollama",
+    },
+    "mistral": {
+        "provider": "ollama",
+        "model_name": "mistral",
+        "class": ChatOllama if OLLAMA_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-ollama",
+    },
+    "phi3": {
+        "provider": "ollama",
+        "model_name": "phi3",
+        "class": ChatOllama if OLLAMA_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-ollama",
+    },
+    "gemini-pro": {
+        "provider": "google",
+        "model_name": "gemini-pro",
+        "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-google-genai",
+    },
+    "gemini-1.5-flash": {
+        "provider": "google",
+        "model_name": "gemini-1.5-flash",
+        "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-google-genai",
+    },
+    "gemini-1.5-pro": {
+        "provider": "google",
+        "model_name": "gemini-1.5-pro",
+        "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-google-genai",
+    },
+    "gemini-2.5-flash": {
+        "provider": "google",
+        "model_name": "gemini-2.5-flash",
+        "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-google-genai",
+    },
+    "gemini-2.5-flash-lite": {
+        "provider": "google",
+        "model_name": "gemini-2.5-flash-lite",
+        "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-google-genai",
+    },
+    "gemini-2.5-pro": {
+        "provider": "google",
+        "model_name": "gemini-2.5-pro",
+        "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
+        "default_temperature": 0.7,
+        "default_max_tokens": 2000,
+        "requires_package": "langchain-google-genai",
+    },
+}
+_DEFAULT_MODEL_CONFIGS = {
+    key: MappingProxyType(config) for key, config in _DEFAULT_MODEL_CONFIGS.items()
+}
+
+
 class DefaultModelConfigRepository:
     """
     Manages model configurations.
@@ -88,174 +254,18 @@ class DefaultModelConfigRepository:
     """
     
     def __init__(self):
-        self._configs: Dict[str, Dict[str, Any]] = self._load_default_configs()
+        self._configs: Dict[str, Mapping[str, Any]] = self._load_default_configs()
         self._configs_lock = Lock()
     
-    def _load_default_configs(self) -> Dict[str, Dict[str, Any]]:
+    def _load_default_configs(self) -> Dict[str, Mapping[str, Any]]:
         """Load default model configurations"""
-        return {
-            "gpt-4": {
-                "provider": "openai",
-                "model_name": "gpt-4",
-                "class": ChatOpenAI,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-            },
-            "gpt-4-turbo": {
-                "provider": "openai",
-                "model_name": "gpt-4-turbo-preview",
-                "class": ChatOpenAI,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-            },
-            "gpt-4o": {
-                "provider": "openai",
-                "model_name": "gpt-4o",
-                "class": ChatOpenAI,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-            },
-            "gpt-3.5-turbo": {
-                "provider": "openai",
-                "model_name": "gpt-3.5-turbo",
-                "class": ChatOpenAI,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-            },
-            "gpt-3.5-turbo-16k": {
-                "provider": "openai",
-                "model_name": "gpt-3.5-turbo-16k",
-                "class": ChatOpenAI,
-                "default_temperature": 0.7,
-                "default_max_tokens": 4000,  # Higher max tokens for 16k context window
-            },
-            "claude-3-opus": {
-                "provider": "anthropic",
-                "model_name": "claude-3-opus-20240229",
-                "class": ChatAnthropic if ANTHROPIC_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-anthropic",
-            },
-            "claude-3-sonnet": {
-                "provider": "anthropic",
-                "model_name": "claude-3-sonnet-20240229",
-                "class": ChatAnthropic if ANTHROPIC_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-anthropic",
-            },
-            "claude-3-haiku": {
-                "provider": "anthropic",
-                "model_name": "claude-3-haiku-20240307",
-                "class": ChatAnthropic if ANTHROPIC_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-anthropic",
-            },
-            "llama2": {
-                "provider": "ollama",
-                "model_name": "llama2",
-                "class": ChatOllama if OLLAMA_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-ollama",
-            },
-            "llama3": {
-                "provider": "ollama",
-                "model_name": "llama3",
-                "class": ChatOllama if OLLAMA_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-ollama",
-            },
-            "llama3.1": {
-                "provider": "ollama",
-                "model_name": "llama3.1",
-                "class": ChatOllama if OLLAMA_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-ollama",
-            },
-            "llama3.2": {
-                "provider": "ollama",
-                "model_name": "llama3.2",
-                "class": ChatOllama if OLLAMA_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-ollama",
-            },
-            "mistral": {
-                "provider": "ollama",
-                "model_name": "mistral",
-                "class": ChatOllama if OLLAMA_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-ollama",
-            },
-            "phi3": {
-                "provider": "ollama",
-                "model_name": "phi3",
-                "class": ChatOllama if OLLAMA_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-ollama",
-            },
-            "gemini-pro": {
-                "provider": "google",
-                "model_name": "gemini-pro",
-                "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-google-genai",
-            },
-            "gemini-1.5-flash": {
-                "provider": "google",
-                "model_name": "gemini-1.5-flash",
-                "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-google-genai",
-            },
-            "gemini-1.5-pro": {
-                "provider": "google",
-                "model_name": "gemini-1.5-pro",
-                "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-google-genai",
-            },
-            "gemini-2.5-flash": {
-                "provider": "google",
-                "model_name": "gemini-2.5-flash",
-                "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-google-genai",
-            },
-            "gemini-2.5-flash-lite": {
-                "provider": "google",
-                "model_name": "gemini-2.5-flash-lite",
-                "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-google-genai",
-            },
-            "gemini-2.5-pro": {
-                "provider": "google",
-                "model_name": "gemini-2.5-pro",
-                "class": ChatGoogleGenerativeAI if GOOGLE_AVAILABLE else None,
-                "default_temperature": 0.7,
-                "default_max_tokens": 2000,
-                "requires_package": "langchain-google-genai",
-            },
-        }
+        return dict(_DEFAULT_MODEL_CONFIGS)
     
-    def get_config(self, model_name: str) -> Dict[str, Any]:
+    def get_config(self, model_name: str) -> Mapping[str, Any]:
         """Get configuration for a model (thread-safe)"""
         with self._configs_lock:
-            if not self.has_model(model_name):
-                available_models = ", ".join(self.list_models())
+            if model_name not in self._configs:
+                available_models = ", ".join(self._configs)
                 raise ValueError(
                     f"Model '{model_name}' is not supported. "
                     f"Available models: {available_models}"
@@ -287,6 +297,7 @@ class SettingsAPIKeyProvider:
     """
     Provides API keys from settings.
     Single Responsibility: Only responsible for retrieving API keys.
+    Stateless, so the shared ``default_api_key_provider`` instance is used by default.
     """
     
     def get_api_key(self, provider: str, override_key: Optional[str] = None) -> Optional[str]:
@@ -321,6 +332,10 @@ class SettingsAPIKeyProvider:
             )
 
 
+# SettingsAPIKeyProvider is stateless; share one instance instead of building one per manager
+default_api_key_provider = SettingsAPIKeyProvider()
+
+
 # ============================================================================
 # Model Provider Factory - Open/Closed Principle & Dependency Inversion
 # ============================================================================
@@ -438,6 +453,15 @@ class OllamaProvider(ModelProvider):
         return ChatOllama(**kwargs)
 
 
+# Providers hold no state, so one instance of each is shared by all factories
+_DEFAULT_PROVIDERS: Dict[str, ModelProvider] = {
+    "openai": OpenAIProvider(),
+    "anthropic": AnthropicProvider(),
+    "google": GoogleProvider(),
+    "ollama": OllamaProvider(),
+}
+
+
 class ModelProviderFactory:
     """
     Factory for creating model providers.
@@ -446,12 +470,7 @@ class ModelProviderFactory:
     """
     
     def __init__(self):
-        self._providers: Dict[str, ModelProvider] = {
-            "openai": OpenAIProvider(),
-            "anthropic": AnthropicProvider(),
-            "google": GoogleProvider(),
-            "ollama": OllamaProvider(),
-        }
+        self._providers: Dict[str, ModelProvider] = dict(_DEFAULT_PROVIDERS)
     
     def get_provider(self, provider_name: str) -> ModelProvider:
         """Get a provider by name"""
@@ -473,6 +492,34 @@ class ModelProviderFactory:
 # Use Case Configuration - Single Responsibility
 # ============================================================================
 
+# Built-in use case settings, shared read-only by every UseCaseConfig
+_DEFAULT_USE_CASE_CONFIGS: Dict[str, Mapping[str, Any]] = {
+    "qa": {
+        "temperature": 0.3,  # Lower temperature for more focused answers
+        "max_tokens": 1000,
+    },
+    "summarization": {
+        "temperature": 0.5,
+        "max_tokens": 500,
+    },
+    "classification": {
+        "temperature": 0.1,  # Very low for consistent classification
+        "max_tokens": 100,
+    },
+    "creative": {
+        "temperature": 0.9,  # Higher for creative tasks
+        "max_tokens": 2000,
+    },
+    "default": {
+        "temperature": 0.7,
+        "max_tokens": 2000,
+    }
+}
+_DEFAULT_USE_CASE_CONFIGS = {
+    key: MappingProxyType(config) for key, config in _DEFAULT_USE_CASE_CONFIGS.items()
+}
+
+
 class UseCaseConfig:
     """
     Manages use case specific configurations.
@@ -480,30 +527,9 @@ class UseCaseConfig:
     """
     
     def __init__(self):
-        self._configs: Dict[str, Dict[str, Any]] = {
-            "qa": {
-                "temperature": 0.3,  # Lower temperature for more focused answers
-                "max_tokens": 1000,
-            },
-            "summarization": {
-                "temperature": 0.5,
-                "max_tokens": 500,
-            },
-            "classification": {
-                "temperature": 0.1,  # Very low for consistent classification
-                "max_tokens": 100,
-            },
-            "creative": {
-                "temperature": 0.9,  # Higher for creative tasks
-                "max_tokens": 2000,
-            },
-            "default": {
-                "temperature": 0.7,
-                "max_tokens": 2000,
-            }
-        }
+        self._configs: Dict[str, Mapping[str, Any]] = dict(_DEFAULT_USE_CASE_CONFIGS)
     
-    def get_config(self, use_case: str) -> Dict[str, Any]:
+    def get_config(self, use_case: str) -> Mapping[str, Any]:
         """Get configuration for a use case"""
         return self._configs.get(use_case, self._configs["default"])
     
@@ -537,7 +563,7 @@ class LLMCache:
         """Cache an LLM instance (thread-safe)"""
         with self._cache_lock:
             self._cache[key] = llm
-            logger.debug(f"Cached LLM instance: {key}")
+            logger.debug("Cached LLM instance: %s", key)
     
     def has(self, key: str) -> bool:
         """Check if key exists in cache (thread-safe)"""
@@ -599,7 +625,7 @@ class LLMManager:
             cache: Cache for LLM instances (default: LLMCache)
         """
         self._config_repository = config_repository or DefaultModelConfigRepository()
-        self._api_key_provider = api_key_provider or SettingsAPIKeyProvider()
+        self._api_key_provider = api_key_provider or default_api_key_provider
         self._provider_factory = provider_factory or ModelProviderFactory()
         self._use_case_config = use_case_config or UseCaseConfig()
         self._cache = cache or LLMCache()
@@ -669,7 +695,7 @@ class LLMManager:
         
         # Return cached instance if available
         if use_cache and self._cache.has(cache_key):
-            logger.debug(f"Returning cached LLM instance: {cache_key}")
+            logger.debug("Returning cached LLM instance: %s", cache_key)
             return self._cache.get(cache_key)
         
         # Create model instance using provider factory
@@ -4,6 +4,7 @@ Memory configuration and management for conversational agents.
 
 from .memory_config import MemoryConfig, MemoryConfigFactory, MemoryStrategy
 from .memory_manager import MemoryManager, InMemoryMemoryManager
+from .redis_memory_manager import RedisMemoryManager
 
 __all__ = [
     "MemoryConfig",
@@ -11,4 +12,5 @@ __all__ = [
     "MemoryStrategy",
     "MemoryManager",
     "InMemoryMemoryManager",
+    "RedisMemoryManager",
 ]
@@ -0,0 +1,76 @@
+"""
+Compact message serialization for remote memory stores.
+
+Plain human/AI/system messages (the bulk of a chat history) are encoded as
+``{"t": <tag>, "c": <content>}``. Anything carrying extra data (tool calls,
+metadata, ids, other message types) falls back to langchain's full
+``message_to_dict`` form under the ``"d"`` tag, so nothing is lost.
+Uses orjson when installed, the standard json module otherwise.
+"""
+from typing import Any, Dict, Type, Union
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+
+_TAGS: Dict[Type[BaseMessage], str] = {HumanMessage: "h", AIMessage: "a", SystemMessage: "s"}
+_TYPES: Dict[str, Type[BaseMessage]] = {tag: message_type for message_type, tag in _TAGS.items()}
+
+
+def _is_plain(message: BaseMessage) -> bool:
+    """Check that a message has nothing besides its content."""
+    if message.additional_kwargs or message.response_metadata or message.name or message.id:
+        return False
+    if isinstance(message, AIMessage):
+        return not (message.tool_calls or message.invalid_tool_calls or message.usage_metadata)
+    return True
+
+
+def dumps(message: BaseMessage) -> bytes:
+    """
+    Serialize a message.
+
+    Args:
+        message: Message to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    tag = _TAGS.get(type(message))
+    if tag is not None and _is_plain(message):
+        data: Dict[str, Any] = {"t": tag, "c": message.content}
+    else:
+        data = {"t": "d", "d": message_to_dict(message)}
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def loads(raw: Union[bytes, str]) -> BaseMessage:
+    """
+    Deserialize a message produced by dumps().
+
+    Args:
+        raw: Serialized message
+
+    Returns:
+        Reconstructed message
+    """
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    message_type = _TYPES.get(data["t"])
+    if message_type is not None:
+        return message_type(content=data["c"])
+    return messages_from_dict([data["d"]])[0]
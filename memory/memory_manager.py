@@ -3,8 +3,12 @@ Memory manager for conversation history.
 Implements memory strategies (trim, summarize, etc.)
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+import asyncio
 from threading import Lock
+from collections import deque
+from itertools import islice
+from functools import lru_cache
 
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langchain_core.language_models import BaseChatModel
@@ -14,12 +18,33 @@ from ..exceptions import MemoryStrategyError
 from ..config.logging_config import logger
 
 
+@lru_cache(maxsize=None)
+def _role_prefix(message_type: type) -> str:
+    """Summary-text prefix for a message class (subclasses such as chunks included)."""
+    if issubclass(message_type, HumanMessage):
+        return "Human: "
+    if issubclass(message_type, AIMessage):
+        return "Assistant: "
+    return ""
+
+
+# Number of striped locks in InMemoryMemoryManager (a power of two)
+_LOCK_STRIPES = 64
+
+# A session split into (system messages, their positions, other messages,
+# absolute index of the first other message). A system message's position
+# is the number of non-system messages added before it.
+_Snapshot = Tuple[List[BaseMessage], List[int], List[BaseMessage], int]
+
+
 class MemoryManager(ABC):
     """
     Abstract memory manager for conversation history.
     Handles storage and retrieval of conversation messages.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     async def get_history(
         self,
@@ -32,7 +57,7 @@ class MemoryManager(ABC):
         Args:
             session_id: Session identifier
             limit: Optional limit on number of messages
-            
+        
         Returns:
             List of messages in chronological order
         """
@@ -80,22 +105,249 @@ class MemoryManager(ABC):
             session_id: Session identifier
             config: Memory configuration
             llm: Optional LLM for summarization
-            
+        
         Returns:
             Processed list of messages
         """
         pass
+    
+    async def apply_memory_strategy_batch(
+        self,
+        session_ids: Iterable[str],
+        config: MemoryConfig,
+        llm: Optional[BaseChatModel] = None
+    ) -> Dict[str, List[BaseMessage]]:
+        """
+        Apply memory strategy to several sessions, e.g. in a housekeeping sweep.
+        
+        The default implementation runs apply_memory_strategy() for all
+        sessions concurrently. Implementations may override it to batch
+        summarization calls.
+        
+        Args:
+            session_ids: Session identifiers
+            config: Memory configuration
+            llm: Optional LLM for summarization
+        
+        Returns:
+            Dictionary mapping session ID to its processed list of messages
+        """
+        session_ids = list(session_ids)
+        results = await asyncio.gather(
+            *(self.apply_memory_strategy(session_id, config, llm) for session_id in session_ids)
+        )
+        return dict(zip(session_ids, results))
+    
+    # Strategy helpers shared by implementations. Each works on a _Snapshot
+    # of a session: system messages are kept apart from the conversation,
+    # with their positions so chronological order can be rebuilt.
+    
+    @staticmethod
+    def _require_llm(config: MemoryConfig, llm: Optional[BaseChatModel]) -> None:
+        """Validate the strategy and that an LLM is given when it summarizes."""
+        if config.strategy in (MemoryStrategy.SUMMARIZE, MemoryStrategy.TRIM_AND_SUMMARIZE):
+            if not llm:
+                raise MemoryStrategyError(
+                    f"LLM is required for {config.strategy.value} strategy"
+                )
+        elif config.strategy not in (MemoryStrategy.NONE, MemoryStrategy.TRIM):
+            raise MemoryStrategyError(f"Unknown strategy: {config.strategy}")
+    
+    @staticmethod
+    def _chronological(
+        system_messages: List[BaseMessage],
+        system_positions: List[int],
+        other_messages: List[BaseMessage],
+        first_index: int
+    ) -> List[BaseMessage]:
+        """
+        Merge system messages back into the conversation in the order they were added.
+        
+        Args:
+            system_messages: System messages in the order they were added
+            system_positions: Number of non-system messages added before each system message
+            other_messages: Consecutive non-system messages
+            first_index: Absolute index of other_messages[0]
+        
+        Returns:
+            Messages in chronological order; system messages older than
+            other_messages[0] come first
+        """
+        messages: List[BaseMessage] = []
+        done = 0
+        for message, position in zip(system_messages, system_positions):
+            upto = min(max(position - first_index, done), len(other_messages))
+            messages.extend(other_messages[done:upto])
+            done = upto
+            messages.append(message)
+        messages.extend(other_messages[done:])
+        return messages
+    
+    @classmethod
+    def _plan(
+        cls,
+        snapshot: _Snapshot,
+        config: MemoryConfig
+    ) -> Tuple[List[BaseMessage], Optional[Iterable[BaseMessage]]]:
+        """
+        Apply everything except the LLM call.
+        
+        Histories a strategy leaves alone are returned in chronological
+        order; trimmed or summarized ones get the system messages first.
+        For TRIM strategies the snapshot may hold only the last
+        trim_keep_messages non-system messages.
+        
+        Returns:
+            (result, None) when no summarization is needed, otherwise
+            (recent messages to keep, lazy iterator over older messages to summarize)
+        """
+        system_messages, _, other_messages, _ = snapshot
+        
+        if config.strategy == MemoryStrategy.NONE:
+            return cls._chronological(*snapshot), None
+        
+        if config.strategy in (MemoryStrategy.TRIM, MemoryStrategy.TRIM_AND_SUMMARIZE):
+            # Keep system messages and only recent other messages
+            if len(system_messages) + len(other_messages) > config.trim_keep_messages:
+                other_messages = other_messages[-config.trim_keep_messages:]
+                trimmed = system_messages + other_messages
+            else:
+                trimmed = cls._chronological(*snapshot)
+            # Then summarize only if still over threshold
+            if config.strategy == MemoryStrategy.TRIM or len(trimmed) <= config.summarize_threshold:
+                return trimmed, None
+            if len(other_messages) <= config.summarize_threshold:
+                return trimmed, None
+        elif (len(system_messages) + len(other_messages) <= config.summarize_threshold
+              or len(other_messages) <= config.summarize_threshold):
+            return cls._chronological(*snapshot), None
+        
+        # Summarize all except the recent messages. The older part is only
+        # read once to build the prompt, so it is not copied into a list.
+        split = len(other_messages) - config.summarize_threshold
+        return other_messages[split:], islice(other_messages, split)
+    
+    def _messages_to_text(self, messages: Iterable[BaseMessage]) -> str:
+        """Convert messages to text for summarization."""
+        return "\n".join(f"{_role_prefix(type(msg))}{msg.content}" for msg in messages)
+    
+    def _summary_prompt(self, messages: Iterable[BaseMessage]) -> str:
+        """Build the summarization prompt for older messages."""
+        return f"Summarize the following conversation history:\n\n{self._messages_to_text(messages)}"
+    
+    @staticmethod
+    def _with_summary(
+        system_messages: List[BaseMessage],
+        summary_response: Any,
+        recent_messages: List[BaseMessage]
+    ) -> List[BaseMessage]:
+        """Replace summarized messages with a summary message."""
+        summary_content = summary_response.content if hasattr(summary_response, 'content') else str(summary_response)
+        summary_message = AIMessage(content=f"[Summarized conversation history: {summary_content}]")
+        return system_messages + [summary_message] + recent_messages
+    
+    async def _apply_to_snapshots(
+        self,
+        snapshots: Dict[str, _Snapshot],
+        config: MemoryConfig,
+        llm: Optional[BaseChatModel]
+    ) -> Dict[str, List[BaseMessage]]:
+        """
+        Apply the strategy to session snapshots.
+        
+        A single summarization uses ``llm.ainvoke()``; several are sent in one
+        ``llm.abatch()`` call (or gathered when the model has no abatch).
+        
+        Raises:
+            MemoryStrategyError: If summarization fails
+        """
+        results: Dict[str, List[BaseMessage]] = {}
+        # (session_id, system messages, recent messages, prompt)
+        pending: List[Tuple[str, List[BaseMessage], List[BaseMessage], str]] = []
+        for session_id, snapshot in snapshots.items():
+            result, to_summarize = self._plan(snapshot, config)
+            if to_summarize is None:
+                results[session_id] = result
+            else:
+                pending.append((session_id, snapshot[0], result, self._summary_prompt(to_summarize)))
+        
+        if not pending:
+            return results
+        
+        prompts = [prompt for _, _, _, prompt in pending]
+        try:
+            if len(prompts) == 1:
+                responses = [await llm.ainvoke(prompts[0])]
+            elif getattr(llm, "abatch", None) is not None:
+                responses = await llm.abatch(prompts)
+            else:
+                responses = await asyncio.gather(*(llm.ainvoke(prompt) for prompt in prompts))
+        except Exception as e:
+            logger.error(f"Failed to summarize messages: {e}", exc_info=True)
+            raise MemoryStrategyError(f"Summarization failed: {str(e)}") from e
+        
+        for (session_id, system_messages, recent_messages, _), response in zip(pending, responses):
+            results[session_id] = self._with_summary(system_messages, response, recent_messages)
+        return {session_id: results[session_id] for session_id in snapshots}
+
+
+class _SessionHistory:
+    """One session's messages in InMemoryMemoryManager."""
+    
+    __slots__ = ("system_messages", "system_positions", "other_messages", "added")
+    
+    def __init__(self, max_messages: Optional[int]):
+        self.system_messages: List[BaseMessage] = []
+        # Value of `added` when each system message was added
+        self.system_positions: List[int] = []
+        self.other_messages: Deque[BaseMessage] = deque(maxlen=max_messages)
+        # Non-system messages ever added (including any the deque dropped)
+        self.added = 0
+    
+    def first_index(self) -> int:
+        """Absolute index of the oldest non-system message still stored."""
+        return self.added - len(self.other_messages)
 
 
 class InMemoryMemoryManager(MemoryManager):
     """
     In-memory implementation of memory manager.
     Suitable for single-process applications and testing.
+    
+    Each session's history is kept pre-partitioned: system messages in one
+    list and all other messages in a deque, so strategies never rescan the
+    full history to separate them. Each system message's position in the
+    conversation is recorded too, so get_history() and strategies that
+    leave the history alone return it in chronological order.
+    
+    When constructed with a TRIM ``default_memory_config``, each session
+    only ever keeps its last ``trim_keep_messages`` non-system messages
+    (a bounded deque drops the oldest on append). Older messages are then
+    unavailable to get_history() and to other strategies, so leave it
+    unset if sessions may switch strategies.
+    
+    Sessions are guarded by striped locks (``hash(session_id)`` picks one of
+    a fixed set), so different sessions rarely contend with each other.
     """
     
-    def __init__(self):
-        self._histories: dict[str, List[BaseMessage]] = {}
-        self._lock = Lock()
+    __slots__ = ("_histories", "_max_messages", "_stripes")
+    
+    def __init__(self, default_memory_config: Optional[MemoryConfig] = None):
+        """
+        Initialize in-memory memory manager.
+        
+        Args:
+            default_memory_config: Optional memory config; a TRIM config bounds stored history
+        """
+        self._histories: Dict[str, _SessionHistory] = {}
+        self._max_messages: Optional[int] = None
+        if default_memory_config is not None and default_memory_config.strategy == MemoryStrategy.TRIM:
+            self._max_messages = default_memory_config.trim_keep_messages
+        self._stripes = tuple(Lock() for _ in range(_LOCK_STRIPES))
+    
+    def _lock_for(self, session_id: str) -> Lock:
+        """Get the lock guarding a session's history."""
+        return self._stripes[hash(session_id) & (_LOCK_STRIPES - 1)]
     
     async def get_history(
         self,
@@ -103,11 +355,19 @@ class InMemoryMemoryManager(MemoryManager):
         limit: Optional[int] = None
     ) -> List[BaseMessage]:
         """Retrieve conversation history."""
-        with self._lock:
-            messages = self._histories.get(session_id, [])
-            if limit:
-                return messages[-limit:]
-            return messages.copy()
+        with self._lock_for(session_id):
+            history = self._histories.get(session_id)
+            if history is None:
+                return []
+            messages = self._chronological(
+                history.system_messages,
+                history.system_positions,
+                list(history.other_messages),
+                history.first_index()
+            )
+        if limit:
+            return messages[-limit:]
+        return messages
     
     async def add_message(
         self,
@@ -115,132 +375,82 @@ class InMemoryMemoryManager(MemoryManager):
         message: BaseMessage
     ) -> None:
         """Add message to history."""
-        with self._lock:
-            if session_id not in self._histories:
-                self._histories[session_id] = []
-            self._histories[session_id].append(message)
-            logger.debug(f"Added message to history for session {session_id}")
+        with self._lock_for(session_id):
+            history = self._histories.get(session_id)
+            if history is None:
+                history = self._histories[session_id] = _SessionHistory(self._max_messages)
+            if isinstance(message, SystemMessage):
+                history.system_messages.append(message)
+                history.system_positions.append(history.added)
+            else:
+                history.other_messages.append(message)
+                history.added += 1
+            logger.debug("Added message to history for session %s", session_id)
     
     async def clear_history(
         self,
         session_id: str
     ) -> None:
         """Clear conversation history."""
-        with self._lock:
+        with self._lock_for(session_id):
             if session_id in self._histories:
                 del self._histories[session_id]
                 logger.info(f"Cleared history for session {session_id}")
     
-    async def apply_memory_strategy(
+    def _snapshot(
         self,
         session_id: str,
-        config: MemoryConfig,
-        llm: Optional[BaseChatModel] = None
-    ) -> List[BaseMessage]:
-        """Apply memory strategy."""
-        with self._lock:
-            messages = self._histories.get(session_id, [])
-            
-            if config.strategy == MemoryStrategy.NONE:
-                return messages.copy()
-            
-            elif config.strategy == MemoryStrategy.TRIM:
-                return self._apply_trim(messages, config)
-            
-            elif config.strategy == MemoryStrategy.SUMMARIZE:
-                if not llm:
-                    raise MemoryStrategyError(
-                        "LLM is required for summarize strategy"
-                    )
-                return await self._apply_summarize(messages, config, llm)
-            
-            elif config.strategy == MemoryStrategy.TRIM_AND_SUMMARIZE:
-                if not llm:
-                    raise MemoryStrategyError(
-                        "LLM is required for trim_and_summarize strategy"
-                    )
-                return await self._apply_trim_and_summarize(messages, config, llm)
-            
-            else:
-                raise MemoryStrategyError(f"Unknown strategy: {config.strategy}")
-    
-    def _apply_trim(
-        self,
-        messages: List[BaseMessage],
         config: MemoryConfig
-    ) -> List[BaseMessage]:
-        """Apply trim strategy - keep only recent messages."""
-        if len(messages) <= config.trim_keep_messages:
-            return messages.copy()
-        
-        # Keep system messages and recent messages
-        system_messages = [m for m in messages if isinstance(m, SystemMessage)]
-        other_messages = [m for m in messages if not isinstance(m, SystemMessage)]
-        recent_messages = other_messages[-config.trim_keep_messages:]
-        
-        return system_messages + recent_messages
+    ) -> _Snapshot:
+        """Copy a session's partitioned history. Caller must hold its lock."""
+        history = self._histories.get(session_id)
+        if history is None:
+            return [], [], [], 0
+        if config.strategy in (MemoryStrategy.TRIM, MemoryStrategy.TRIM_AND_SUMMARIZE):
+            # Trimming never keeps more than the last trim_keep_messages
+            # non-system messages, so only copy that tail (from the end).
+            other_messages = list(islice(reversed(history.other_messages), config.trim_keep_messages))
+            other_messages.reverse()
+        else:
+            other_messages = list(history.other_messages)
+        return (
+            history.system_messages.copy(),
+            history.system_positions.copy(),
+            other_messages,
+            history.added - len(other_messages)
+        )
     
-    async def _apply_summarize(
+    async def apply_memory_strategy(
         self,
-        messages: List[BaseMessage],
+        session_id: str,
         config: MemoryConfig,
-        llm: BaseChatModel
+        llm: Optional[BaseChatModel] = None
     ) -> List[BaseMessage]:
-        """Apply summarize strategy - summarize old messages."""
-        if len(messages) <= config.summarize_threshold:
-            return messages.copy()
-        
-        # Separate system messages, old messages, and recent messages
-        system_messages = [m for m in messages if isinstance(m, SystemMessage)]
-        other_messages = [m for m in messages if not isinstance(m, SystemMessage)]
-        
-        if len(other_messages) <= config.summarize_threshold:
-            return messages.copy()
-        
-        # Messages to summarize (all except recent ones)
-        messages_to_summarize = other_messages[:-config.summarize_threshold]
-        recent_messages = other_messages[-config.summarize_threshold:]
-        
-        # Create summary
-        summary_text = self._messages_to_text(messages_to_summarize)
-        summary_prompt = f"Summarize the following conversation history:\n\n{summary_text}"
-        
-        try:
-            summary_response = await llm.ainvoke(summary_prompt)
-            summary_content = summary_response.content if hasattr(summary_response, 'content') else str(summary_response)
-            
-            # Create summary message
-            summary_message = AIMessage(content=f"[Summarized conversation history: {summary_content}]")
-            
-            return system_messages + [summary_message] + recent_messages
-        except Exception as e:
-            logger.error(f"Failed to summarize messages: {e}", exc_info=True)
-            raise MemoryStrategyError(f"Summarization failed: {str(e)}") from e
+        """Apply memory strategy."""
+        self._require_llm(config, llm)
+        # Snapshot under the lock; summarization awaits the LLM, which must
+        # not happen while holding a threading lock.
+        with self._lock_for(session_id):
+            snapshot = self._snapshot(session_id, config)
+        results = await self._apply_to_snapshots({session_id: snapshot}, config, llm)
+        return results[session_id]
     
-    async def _apply_trim_and_summarize(
+    async def apply_memory_strategy_batch(
         self,
-        messages: List[BaseMessage],
+        session_ids: Iterable[str],
         config: MemoryConfig,
-        llm: BaseChatModel
-    ) -> List[BaseMessage]:
-        """Apply both trim and summarize strategies."""
-        # First trim
-        trimmed = self._apply_trim(messages, config)
-        
-        # Then summarize if still over threshold
-        if len(trimmed) > config.summarize_threshold:
-            return await self._apply_summarize(trimmed, config, llm)
+        llm: Optional[BaseChatModel] = None
+    ) -> Dict[str, List[BaseMessage]]:
+        """
+        Apply memory strategy to several sessions.
         
-        return trimmed
-    
-    def _messages_to_text(self, messages: List[BaseMessage]) -> str:
-        """Convert messages to text for summarization."""
-        text_parts = []
-        for msg in messages:
-            if isinstance(msg, HumanMessage):
-                text_parts.append(f"Human: {msg.content}")
-            elif isinstance(msg, AIMessage):
-                text_parts.append(f"Assistant: {msg.content}")
-            else:
-                text_parts.append(str(msg.content))
-        return "\n".join(text_parts)
+        All summarization prompts are sent in one ``llm.abatch()`` call
+        instead of one round trip per session.
+        """
+        self._require_llm(config, llm)
+        # No cross-session consistency is needed, so lock one session at a time
+        snapshots = {}
+        for session_id in session_ids:
+            with self._lock_for(session_id):
+                snapshots[session_id] = self._snapshot(session_id, config)
+        return await self._apply_to_snapshots(snapshots, config, llm)
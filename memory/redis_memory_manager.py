@@ -0,0 +1,191 @@
+"""
+Redis-backed memory manager for multi-worker deployments.
+
+Each session is stored as Redis lists: ``{prefix}:{session_id}`` for the
+conversation and ``{prefix}:{session_id}:system`` for system messages, plus
+the position of each system message in the conversation, so all workers
+share one history, trimming happens server-side and history is still read
+back in chronological order.
+Requires the optional ``redis`` package.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.language_models import BaseChatModel
+
+try:
+    from redis.asyncio import Redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    Redis = None
+
+from .memory_config import MemoryConfig, MemoryStrategy
+from .memory_manager import MemoryManager, _Snapshot
+from ._serialization import dumps, loads
+from ..config.settings import settings
+from ..config.logging_config import logger
+
+
+class RedisMemoryManager(MemoryManager):
+    """
+    Redis implementation of memory manager.
+    Suitable for deployments with several worker processes or servers.
+    
+    Messages are stored as compact tagged JSON (see ``_serialization``),
+    never pickled, so reading history cannot execute code. When constructed with a TRIM
+    ``default_memory_config``, every add is followed by ``LTRIM`` in the
+    same round trip, bounding each session server-side.
+    """
+    
+    __slots__ = ("_redis", "_key_prefix", "_max_messages")
+    
+    def __init__(
+        self,
+        client: Optional["Redis"] = None,
+        key_prefix: str = "chat",
+        default_memory_config: Optional[MemoryConfig] = None
+    ):
+        """
+        Initialize Redis memory manager.
+        
+        Args:
+            client: Optional ``redis.asyncio.Redis`` client (default: from settings.REDIS_URL)
+            key_prefix: Prefix for session keys
+            default_memory_config: Optional memory config; a TRIM config bounds stored history
+        
+        Raises:
+            ValueError: If the redis package is not installed
+        """
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise ValueError(
+                    "RedisMemoryManager requires the 'redis' package. "
+                    "Please install it using: pip install redis"
+                )
+            # from_url creates a connection pool shared by all calls
+            client = Redis.from_url(settings.REDIS_URL, db=settings.REDIS_DB)
+        self._redis = client
+        self._key_prefix = key_prefix
+        self._max_messages: Optional[int] = None
+        if default_memory_config is not None and default_memory_config.strategy == MemoryStrategy.TRIM:
+            self._max_messages = default_memory_config.trim_keep_messages
+    
+    def _keys(self, session_id: str) -> Tuple[str, str, str, str]:
+        """
+        Get the keys for a session.
+        
+        Returns:
+            (system messages, system message positions, count of non-system
+            messages ever added, conversation)
+        """
+        key = f"{self._key_prefix}:{session_id}"
+        return f"{key}:system", f"{key}:system_pos", f"{key}:count", key
+    
+    async def _fetch(
+        self,
+        session_ids: List[str],
+        tail: Optional[int] = None
+    ) -> Dict[str, _Snapshot]:
+        """Read partitioned histories for sessions in one round trip."""
+        start = -tail if tail else 0
+        pipe = self._redis.pipeline(transaction=False)
+        for session_id in session_ids:
+            system_key, positions_key, count_key, key = self._keys(session_id)
+            pipe.lrange(system_key, 0, -1)
+            pipe.lrange(positions_key, 0, -1)
+            pipe.get(count_key)
+            pipe.lrange(key, start, -1)
+        raw = await pipe.execute()
+        snapshots = {}
+        for i, session_id in enumerate(session_ids):
+            system_items, positions, count, items = raw[4 * i:4 * i + 4]
+            other_messages = [loads(item) for item in items]
+            snapshots[session_id] = (
+                [loads(item) for item in system_items],
+                [int(position) for position in positions],
+                other_messages,
+                int(count or 0) - len(other_messages)
+            )
+        return snapshots
+    
+    async def get_history(
+        self,
+        session_id: str,
+        limit: Optional[int] = None
+    ) -> List[BaseMessage]:
+        """Retrieve conversation history."""
+        # The last `limit` messages hold at most `limit` non-system ones
+        snapshot = (await self._fetch([session_id], tail=limit))[session_id]
+        messages = self._chronological(*snapshot)
+        if limit:
+            return messages[-limit:]
+        return messages
+    
+    async def add_message(
+        self,
+        session_id: str,
+        message: BaseMessage
+    ) -> None:
+        """Add message to history."""
+        system_key, positions_key, count_key, key = self._keys(session_id)
+        data = dumps(message)
+        if isinstance(message, SystemMessage):
+            async def add_system(pipe) -> None:
+                # Record the position against a watched count, so a concurrent
+                # add between reading and writing it retries the transaction
+                position = int(await pipe.get(count_key) or 0)
+                pipe.multi()
+                pipe.rpush(system_key, data)
+                pipe.rpush(positions_key, position)
+            
+            await self._redis.transaction(add_system, count_key)
+        else:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.rpush(key, data)
+            pipe.incr(count_key)
+            if self._max_messages is not None:
+                pipe.ltrim(key, -self._max_messages, -1)
+            await pipe.execute()
+        logger.debug("Added message to history for session %s", session_id)
+    
+    async def clear_history(
+        self,
+        session_id: str
+    ) -> None:
+        """Clear conversation history."""
+        await self._redis.delete(*self._keys(session_id))
+        logger.info(f"Cleared history for session {session_id}")
+    
+    def _tail_for(self, config: MemoryConfig) -> Optional[int]:
+        """Trimming never keeps more than trim_keep_messages, so only read that tail."""
+        if config.strategy in (MemoryStrategy.TRIM, MemoryStrategy.TRIM_AND_SUMMARIZE):
+            return config.trim_keep_messages
+        return None
+    
+    async def apply_memory_strategy(
+        self,
+        session_id: str,
+        config: MemoryConfig,
+        llm: Optional[BaseChatModel] = None
+    ) -> List[BaseMessage]:
+        """Apply memory strategy."""
+        self._require_llm(config, llm)
+        snapshots = await self._fetch([session_id], tail=self._tail_for(config))
+        return (await self._apply_to_snapshots(snapshots, config, llm))[session_id]
+    
+    async def apply_memory_strategy_batch(
+        self,
+        session_ids: Iterable[str],
+        config: MemoryConfig,
+        llm: Optional[BaseChatModel] = None
+    ) -> Dict[str, List[BaseMessage]]:
+        """
+        Apply memory strategy to several sessions.
+        
+        Histories are read in one pipelined round trip and all summarization
+        prompts are sent in one ``llm.abatch()`` call.
+        """
+        self._require_llm(config, llm)
+        snapshots = await self._fetch(list(dict.fromkeys(session_ids)), tail=self._tail_for(config))
+        return await self._apply_to_snapshots(snapshots, config, llm)
@@ -3,11 +3,13 @@ Observability: metrics, tracing, and monitoring.
 """
 
 from .metrics import MetricsCollector, InMemoryMetricsCollector
+from .prom_metrics import PrometheusMetricsCollector
 from .tracing import TraceContext, get_trace_context
 
 __all__ = [
     "MetricsCollector",
     "InMemoryMetricsCollector",
+    "PrometheusMetricsCollector",
     "TraceContext",
     "get_trace_context",
 ]
@@ -2,13 +2,20 @@
 Metrics collection for observability.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-from threading import Lock
-from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from threading import Lock, Thread
+from queue import Empty, SimpleQueue
 from collections import defaultdict
+from dataclasses import dataclass
+from array import array
+from math import ceil
 
+from .._compat import DATACLASS_SLOTS
 from ..config.logging_config import logger
 
+# Kinds of events queued by InMemoryMetricsCollector
+_LATENCY, _ERROR, _TOKENS, _COUNTER = range(4)
+
 
 class MetricsCollector(ABC):
     """
@@ -16,6 +23,8 @@ class MetricsCollector(ABC):
     Implementations can send metrics to Prometheus, StatsD, etc.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def record_latency(
         self,
@@ -33,6 +42,25 @@ class MetricsCollector(ABC):
         """
         pass
     
+    def record_latency_ns(
+        self,
+        operation: str,
+        ns: int,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Record operation latency measured with ``time.perf_counter_ns()``.
+        
+        The default implementation converts to seconds and delegates to
+        record_latency(); collectors that store nanoseconds override it.
+        
+        Args:
+            operation: Operation name
+            ns: Duration in nanoseconds
+            tags: Optional tags for filtering
+        """
+        self.record_latency(operation, ns / 1e9, tags)
+    
     @abstractmethod
     def record_error(
         self,
@@ -87,18 +115,172 @@ class MetricsCollector(ABC):
         pass
 
 
+@dataclass(**DATACLASS_SLOTS)
+class LatencyAggregate:
+    """Running latency statistics for one operation, in integer nanoseconds."""
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+
+    def add(self, ns: int) -> None:
+        """Fold one duration into the aggregate."""
+        self.count += 1
+        self.total_ns += ns
+        if self.count == 1 or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+
+@dataclass(**DATACLASS_SLOTS)
+class TokenUsageAggregate:
+    """Running token usage totals for one model."""
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+def _percentiles(samples: array) -> Dict[str, float]:
+    """Nearest-rank p50/p95/p99 in seconds of a non-empty nanosecond sample array."""
+    ordered = sorted(samples)
+    return {
+        name: ordered[max(0, ceil(q * len(ordered)) - 1)] / 1e9
+        for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+    }
+
+
 class InMemoryMetricsCollector(MetricsCollector):
     """
     In-memory metrics collector.
     Stores metrics in memory for testing and development.
+    
+    Only running aggregates are kept (not individual samples), so memory
+    stays bounded by the number of distinct operations and models.
+    
+    Set ``keep_latency_samples`` to also keep every latency sample so the
+    summary can report p50/p95/p99. Samples are stored in ``array('q')``
+    as integer nanoseconds (8 bytes each, contiguous) rather than a list of
+    float objects, but memory still grows with traffic; leave it off when
+    running statistics are enough.
+    
+    The record_* methods do not take the lock: they put the event on a
+    ``queue.SimpleQueue`` and return. Pending events are folded into the
+    aggregates under the lock when a summary is read, or by a writer once
+    the backlog reaches ``flush_threshold`` and the lock happens to be free.
+    Call start() to fold events on a background thread instead, keeping
+    aggregation off the request path entirely; with a LifecycleManager:
+    
+        lifecycle.add_startup_hook(metrics.start)
+        lifecycle.add_shutdown_hook(metrics.stop)
     """
     
-    def __init__(self):
-        self._latencies: Dict[str, List[float]] = defaultdict(list)
-        self._errors: Dict[str, List[Exception]] = defaultdict(list)
-        self._token_usage: Dict[str, List[Dict]] = defaultdict(list)
+    __slots__ = (
+        "_latencies",
+        "_latency_samples",
+        "_errors",
+        "_token_usage",
+        "_counters",
+        "_pending",
+        "_flush_threshold",
+        "_lock",
+        "_drainer",
+    )
+    
+    def __init__(self, flush_threshold: int = 1024, keep_latency_samples: bool = False):
+        """
+        Initialize in-memory metrics collector.
+        
+        Args:
+            flush_threshold: Pending events after which writers try to fold them
+            keep_latency_samples: Keep raw latency samples for percentiles
+        """
+        self._latencies: Dict[str, LatencyAggregate] = defaultdict(LatencyAggregate)
+        self._latency_samples: Optional[Dict[str, array]] = {} if keep_latency_samples else None
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._token_usage: Dict[str, TokenUsageAggregate] = defaultdict(TokenUsageAggregate)
         self._counters: Dict[str, int] = defaultdict(int)
+        # (kind, key, value, extra) events not yet folded into the aggregates
+        self._pending: "SimpleQueue[Optional[Tuple[int, str, Any, Any]]]" = SimpleQueue()
+        self._flush_threshold = flush_threshold
         self._lock = Lock()
+        self._drainer: Optional[Thread] = None
+    
+    def start(self) -> None:
+        """Start folding events on a background thread (idempotent)."""
+        with self._lock:
+            if self._drainer is None:
+                self._drainer = Thread(target=self._drain_forever, name="metrics-drainer", daemon=True)
+                self._drainer.start()
+                logger.info("Started metrics drainer thread")
+    
+    def stop(self) -> None:
+        """Stop the background thread after it folds everything queued so far."""
+        drainer = self._drainer
+        if drainer is not None:
+            self._pending.put(None)
+            drainer.join()
+            self._drainer = None
+            logger.info("Stopped metrics drainer thread")
+    
+    def _drain_forever(self) -> None:
+        """Background loop: block for an event, then fold it and any backlog."""
+        pending = self._pending
+        while True:
+            event = pending.get()
+            if event is None:
+                return
+            with self._lock:
+                self._fold(event)
+                self._fold_pending()
+    
+    def _push(self, event: Tuple[int, str, Any, Any]) -> None:
+        """Queue an event, folding the backlog if it is large and nobody else is."""
+        pending = self._pending
+        pending.put(event)
+        if (
+            self._drainer is None
+            and pending.qsize() >= self._flush_threshold
+            and self._lock.acquire(blocking=False)
+        ):
+            try:
+                self._fold_pending()
+            finally:
+                self._lock.release()
+    
+    def _fold_pending(self) -> None:
+        """Fold all queued events into the aggregates. Caller must hold the lock."""
+        pending = self._pending
+        while True:
+            try:
+                event = pending.get_nowait()
+            except Empty:
+                return
+            if event is None:
+                # Stop request for the drainer; hand it back
+                pending.put(None)
+                return
+            self._fold(event)
+    
+    def _fold(self, event: Tuple[int, str, Any, Any]) -> None:
+        """Fold one event into the aggregates. Caller must hold the lock."""
+        kind, key, value, extra = event
+        if kind == _LATENCY:
+            self._latencies[key].add(value)
+            if self._latency_samples is not None:
+                samples = self._latency_samples.get(key)
+                if samples is None:
+                    samples = self._latency_samples[key] = array('q')
+                samples.append(value)
+        elif kind == _ERROR:
+            self._errors[key] += 1
+        elif kind == _TOKENS:
+            usage = self._token_usage[key]
+            usage.requests += 1
+            usage.input_tokens += value
+            usage.output_tokens += extra
+        else:
+            self._counters[key] += value
     
     def record_latency(
         self,
@@ -107,9 +289,17 @@ class InMemoryMetricsCollector(MetricsCollector):
         tags: Optional[Dict[str, str]] = None
     ) -> None:
         """Record operation latency."""
-        with self._lock:
-            self._latencies[operation].append(duration)
-            logger.debug(f"Recorded latency: {operation}={duration}s")
+        self.record_latency_ns(operation, int(duration * 1e9), tags)
+    
+    def record_latency_ns(
+        self,
+        operation: str,
+        ns: int,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Record operation latency in nanoseconds."""
+        self._push((_LATENCY, operation, ns, None))
+        logger.debug("Recorded latency: %s=%dns", operation, ns)
     
     def record_error(
         self,
@@ -118,9 +308,8 @@ class InMemoryMetricsCollector(MetricsCollector):
         tags: Optional[Dict[str, str]] = None
     ) -> None:
         """Record error occurrence."""
-        with self._lock:
-            self._errors[operation].append(error)
-            logger.warning(f"Recorded error: {operation}={type(error).__name__}: {str(error)}")
+        self._push((_ERROR, operation, None, None))
+        logger.warning("Recorded error: %s=%s: %s", operation, type(error).__name__, error)
     
     def record_token_usage(
         self,
@@ -130,14 +319,8 @@ class InMemoryMetricsCollector(MetricsCollector):
         tags: Optional[Dict[str, str]] = None
     ) -> None:
         """Record token usage."""
-        with self._lock:
-            self._token_usage[model].append({
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "total_tokens": input_tokens + output_tokens,
-                "timestamp": datetime.now().isoformat()
-            })
-            logger.debug(f"Recorded token usage: {model} (in={input_tokens}, out={output_tokens})")
+        self._push((_TOKENS, model, input_tokens, output_tokens))
+        logger.debug("Recorded token usage: %s (in=%s, out=%s)", model, input_tokens, output_tokens)
     
     def increment_counter(
         self,
@@ -146,9 +329,8 @@ class InMemoryMetricsCollector(MetricsCollector):
         tags: Optional[Dict[str, str]] = None
     ) -> None:
         """Increment a counter."""
-        with self._lock:
-            self._counters[name] += value
-            logger.debug(f"Incremented counter: {name}={self._counters[name]}")
+        self._push((_COUNTER, name, value, None))
+        logger.debug("Incremented counter: %s+=%s", name, value)
     
     def get_metrics_summary(self) -> Dict:
         """
@@ -158,25 +340,28 @@ class InMemoryMetricsCollector(MetricsCollector):
             Dictionary with metrics summary
         """
         with self._lock:
+            self._fold_pending()
             summary = {
                 "latencies": {
                     op: {
-                        "count": len(latencies),
-                        "avg": sum(latencies) / len(latencies) if latencies else 0,
-                        "min": min(latencies) if latencies else 0,
-                        "max": max(latencies) if latencies else 0,
+                        "count": agg.count,
+                        "avg": agg.total_ns / agg.count / 1e9,
+                        "avg_ms": agg.total_ns / agg.count / 1e6,
+                        "min": agg.min_ns / 1e9,
+                        "max": agg.max_ns / 1e9,
                     }
-                    for op, latencies in self._latencies.items()
+                    for op, agg in self._latencies.items()
                 },
-                "errors": {
-                    op: len(errors)
-                    for op, errors in self._errors.items()
+                "latency_percentiles": {
+                    op: _percentiles(samples)
+                    for op, samples in (self._latency_samples or {}).items()
                 },
+                "errors": dict(self._errors),
                 "token_usage": {
                     model: {
-                        "total_requests": len(usage),
-                        "total_input_tokens": sum(u["input_tokens"] for u in usage),
-                        "total_output_tokens": sum(u["output_tokens"] for u in usage),
+                        "total_requests": usage.requests,
+                        "total_input_tokens": usage.input_tokens,
+                        "total_output_tokens": usage.output_tokens,
                     }
                     for model, usage in self._token_usage.items()
                 },
@@ -187,7 +372,10 @@ class InMemoryMetricsCollector(MetricsCollector):
     def clear(self) -> None:
         """Clear all collected metrics."""
         with self._lock:
+            self._fold_pending()
             self._latencies.clear()
+            if self._latency_samples is not None:
+                self._latency_samples.clear()
             self._errors.clear()
             self._token_usage.clear()
             self._counters.clear()
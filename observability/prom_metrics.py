@@ -0,0 +1,142 @@
+"""
+Prometheus metrics collector for production deployments.
+Requires the optional ``prometheus-client`` package.
+"""
+from typing import Any, Dict, Optional
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, Histogram, make_asgi_app
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CollectorRegistry = None
+
+from .metrics import MetricsCollector
+from ..config.logging_config import logger
+
+
+class PrometheusMetricsCollector(MetricsCollector):
+    """
+    Metrics collector backed by ``prometheus_client``.
+    
+    Latencies go to a histogram labelled by operation, errors and token
+    usage to labelled counters, and increment_counter() to a single
+    ``<namespace>_events_total`` counter labelled by name, so custom names
+    never clash with the built-in metrics. Thread safety is handled by
+    prometheus_client itself. Per-call ``tags`` are ignored, because
+    Prometheus label names are fixed when a metric is created.
+    
+    Each collector registers in its own registry unless one is passed in,
+    so several collectors can coexist; pass ``prometheus_client.REGISTRY``
+    to expose the metrics through the default registry instead.
+    
+    Expose the metrics by mounting ``make_asgi_app()``:
+        app.mount("/metrics", collector.make_asgi_app())
+    """
+    
+    def __init__(
+        self,
+        namespace: str = "gen_ai",
+        registry: Optional["CollectorRegistry"] = None
+    ):
+        """
+        Initialize Prometheus metrics collector.
+        
+        Args:
+            namespace: Prefix for all metric names
+            registry: Registry to register metrics in (default: a new private registry)
+        
+        Raises:
+            ValueError: If prometheus-client is not installed
+        """
+        if not PROMETHEUS_AVAILABLE:
+            raise ValueError(
+                "PrometheusMetricsCollector requires the 'prometheus-client' package. "
+                "Please install it using: pip install prometheus-client"
+            )
+        self._registry = registry if registry is not None else CollectorRegistry()
+        self._latency = Histogram(
+            "operation_latency_seconds",
+            "Operation latency in seconds",
+            labelnames=("operation",),
+            namespace=namespace,
+            registry=self._registry,
+        )
+        self._errors = Counter(
+            "errors",
+            "Errors by operation and exception type",
+            labelnames=("operation", "error_type"),
+            namespace=namespace,
+            registry=self._registry,
+        )
+        self._tokens = Counter(
+            "tokens",
+            "LLM tokens by model and direction",
+            labelnames=("model", "direction"),
+            namespace=namespace,
+            registry=self._registry,
+        )
+        self._events = Counter(
+            "events",
+            "Custom events by name",
+            labelnames=("name",),
+            namespace=namespace,
+            registry=self._registry,
+        )
+    
+    def record_latency(
+        self,
+        operation: str,
+        duration: float,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Record operation latency."""
+        self._latency.labels(operation).observe(duration)
+    
+    def record_latency_ns(
+        self,
+        operation: str,
+        ns: int,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Record operation latency in nanoseconds."""
+        self._latency.labels(operation).observe(ns / 1e9)
+    
+    def record_error(
+        self,
+        operation: str,
+        error: Exception,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Record error occurrence."""
+        self._errors.labels(operation, type(error).__name__).inc()
+        logger.warning("Recorded error: %s=%s: %s", operation, type(error).__name__, error)
+    
+    def record_token_usage(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Record token usage."""
+        self._tokens.labels(model, "input").inc(input_tokens)
+        self._tokens.labels(model, "output").inc(output_tokens)
+    
+    def increment_counter(
+        self,
+        name: str,
+        value: int = 1,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Increment the events counter for ``name``."""
+        self._events.labels(name).inc(value)
+    
+    def make_asgi_app(self) -> Any:
+        """
+        Create an ASGI app serving this collector's registry in Prometheus format.
+        
+        Returns:
+            ASGI application to mount (e.g. at ``/metrics``)
+        """
+        return make_asgi_app(registry=self._registry)
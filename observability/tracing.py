@@ -1,11 +1,63 @@
 """
 Distributed tracing support.
 """
+from collections import ChainMap
 from contextlib import contextmanager
-from typing import Optional, Dict, Any
-import uuid
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, MutableMapping
+import logging
+import os
+import random
+import threading
+import time
 
 from ..config.logging_config import logger
+from ..config.settings import settings
+
+
+# Random bytes are read from the OS in blocks and handed out a few at a time,
+# so generating an id is a slice instead of a uuid4() per id.
+_RANDOM_BLOCK_SIZE = 4096
+_ULID_RANDOM_BYTES = 10
+_id_state = threading.local()
+
+# Crockford base32, two digits (10 bits) per table entry
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_CROCKFORD_PAIRS = tuple(a + b for a in _CROCKFORD for b in _CROCKFORD)
+
+
+def _reset_id_state() -> None:
+    """Drop buffered random bytes (a forked child must not reuse its parent's)."""
+    global _id_state
+    _id_state = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_state)
+
+
+def _random_bytes(n: int) -> bytes:
+    """Take n bytes from this thread's buffered block of OS randomness."""
+    state = _id_state
+    buf = getattr(state, "buf", None)
+    off = getattr(state, "off", 0)
+    if buf is None or off + n > len(buf):
+        buf = state.buf = os.urandom(_RANDOM_BLOCK_SIZE)
+        off = 0
+    state.off = off + n
+    return buf[off:off + n]
+
+
+def _ulid() -> str:
+    """
+    Generate a ULID: 48-bit millisecond timestamp + 80 random bits.
+    
+    Returns:
+        26-character Crockford base32 string; ids sort by creation time
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(_random_bytes(_ULID_RANDOM_BYTES), "big")
+    pairs = _CROCKFORD_PAIRS
+    return "".join([pairs[(value >> shift) & 0x3FF] for shift in range(120, -1, -10)])
 
 
 class TraceContext:
@@ -14,12 +66,15 @@ class TraceContext:
     Tracks request traces across service boundaries.
     """
     
+    __slots__ = ("trace_id", "span_id", "parent_span_id", "metadata", "sampled")
+    
     def __init__(
         self,
         trace_id: Optional[str] = None,
         span_id: Optional[str] = None,
         parent_span_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[MutableMapping[str, Any]] = None,
+        sampled: Optional[bool] = None
     ):
         """
         Initialize trace context.
@@ -28,12 +83,17 @@ class TraceContext:
             trace_id: Trace identifier (generated if not provided)
             span_id: Span identifier (generated if not provided)
             parent_span_id: Parent span identifier
-            metadata: Optional metadata
+            metadata: Optional metadata (child spans get a ChainMap over the parent's)
+            sampled: Whether spans are recorded (default: decided by settings.TRACE_SAMPLE_RATE)
         """
-        self.trace_id = trace_id or str(uuid.uuid4())
-        self.span_id = span_id or str(uuid.uuid4())
+        self.trace_id = trace_id or _ulid()
+        self.span_id = span_id or _ulid()
         self.parent_span_id = parent_span_id
-        self.metadata = metadata or {}
+        self.metadata = metadata if metadata is not None else {}
+        if sampled is None:
+            rate = settings.TRACE_SAMPLE_RATE
+            sampled = rate >= 1.0 or random.random() < rate
+        self.sampled = sampled
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert trace context to dictionary."""
@@ -41,7 +101,8 @@ class TraceContext:
             "trace_id": self.trace_id,
             "span_id": self.span_id,
             "parent_span_id": self.parent_span_id,
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
+            "sampled": self.sampled,
         }
     
     @classmethod
@@ -52,45 +113,91 @@ class TraceContext:
             span_id=data.get("span_id"),
             parent_span_id=data.get("parent_span_id"),
             metadata=data.get("metadata", {}),
+            sampled=data.get("sampled"),
         )
     
     @contextmanager
     def span(self, operation: str, metadata: Optional[Dict[str, Any]] = None):
         """
         Create a child span.
+        When this trace is not sampled, yields a shared no-op span instead.
         
         Args:
             operation: Operation name
             metadata: Optional span metadata
         """
+        if not self.sampled:
+            yield _NOOP_SPAN
+            return
+        # Layer the child's metadata over the parent's instead of copying it;
+        # writes to the child go to its own layer
+        child_metadata = dict(metadata) if metadata else {}
+        if isinstance(self.metadata, ChainMap):
+            child_metadata = self.metadata.new_child(child_metadata)
+        else:
+            child_metadata = ChainMap(child_metadata, self.metadata)
         child_span = TraceContext(
             trace_id=self.trace_id,
             parent_span_id=self.span_id,
-            metadata={**(self.metadata), **(metadata or {})}
+            metadata=child_metadata,
+            sampled=True
         )
-        logger.debug(f"Starting span: {operation} (trace_id={self.trace_id}, span_id={child_span.span_id})")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Starting span: %s (trace_id=%s, span_id=%s)", operation, self.trace_id, child_span.span_id)
         try:
             yield child_span
         finally:
-            logger.debug(f"Ending span: {operation} (trace_id={self.trace_id}, span_id={child_span.span_id})")
+            if debug:
+                logger.debug("Ending span: %s (trace_id=%s, span_id=%s)", operation, self.trace_id, child_span.span_id)
+
+
+class _NoopSpan(TraceContext):
+    """
+    Span handed out for unsampled traces.
+    Has fixed zero ids, creates no children and discards metadata writes.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self):
+        self.trace_id = "0" * 26
+        self.span_id = "0" * 26
+        self.parent_span_id = None
+        self.sampled = False
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """A fresh empty dict, so writes are never shared between callers."""
+        return {}
+    
+    @metadata.setter
+    def metadata(self, value: MutableMapping[str, Any]) -> None:
+        pass
+    
+    @contextmanager
+    def span(self, operation: str, metadata: Optional[Dict[str, Any]] = None):
+        """Yield this span again."""
+        yield self
+
+
+_NOOP_SPAN = _NoopSpan()
 
 
-# Global trace context storage (thread-local in production)
-_trace_context: Optional[TraceContext] = None
+# Current trace context, per thread and per asyncio task
+_trace_context: ContextVar[Optional[TraceContext]] = ContextVar("trace_ctx", default=None)
 
 
 def get_trace_context() -> Optional[TraceContext]:
     """Get current trace context."""
-    return _trace_context
+    return _trace_context.get()
 
 
 def set_trace_context(context: TraceContext) -> None:
     """Set current trace context."""
-    global _trace_context
-    _trace_context = context
+    _trace_context.set(context)
 
 
 def clear_trace_context() -> None:
     """Clear current trace context."""
-    global _trace_context
-    _trace_context = None
+    _trace_context.set(None)
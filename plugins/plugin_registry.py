@@ -1,14 +1,18 @@
 """
 Plugin interface and registry for extending functionality.
 """
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Set
 from threading import Lock
 
-from ..dependencies.application_container import ApplicationContainer
 from ..config.logging_config import logger
 from ..exceptions import GenAICoreException
 
+if TYPE_CHECKING:
+    from ..dependencies.application_container import ApplicationContainer
+
 
 class Plugin(ABC):
     """
@@ -58,29 +62,73 @@ class Plugin(ABC):
 class PluginRegistry:
     """
     Registry for managing plugins.
+    
+    Writes replace ``_plugins`` with an updated copy under the lock, and the
+    dict is never mutated in place, so reads use the current reference
+    without locking.
+    
+    Plugins registered with ``required=False`` are skipped by
+    initialize_all() and initialized on their first get_plugin() call
+    instead, so plugins that are never used cost nothing at startup.
     """
     
     def __init__(self):
         self._plugins: Dict[str, Plugin] = {}
         self._lock = Lock()
+        self._lazy: Set[str] = set()
+        self._initialized: Set[str] = set()
+        self._init_locks: Dict[str, Lock] = {}
+        self._container: Optional[ApplicationContainer] = None
     
-    def register(self, plugin: Plugin) -> None:
+    def register(self, plugin: Plugin, required: bool = True) -> None:
         """
         Register a plugin.
         
         Args:
             plugin: Plugin instance
+            required: Initialize in initialize_all() (False defers it to first get_plugin())
         """
         with self._lock:
             name = plugin.get_name()
             if name in self._plugins:
-                logger.warning(f"Plugin '{name}' already registered, overwriting")
-            self._plugins[name] = plugin
-            logger.info(f"Registered plugin: {name} (version: {plugin.get_version()})")
+                logger.warning("Plugin '%s' already registered, overwriting", name)
+            self._initialized.discard(name)
+            self._init_locks[name] = Lock()
+            if required:
+                self._lazy.discard(name)
+            else:
+                self._lazy.add(name)
+            self._plugins = {**self._plugins, name: plugin}
+            logger.info("Registered plugin: %s (version: %s)", name, plugin.get_version())
+    
+    def _initialize(self, name: str, plugin: Plugin, container: ApplicationContainer) -> None:
+        """
+        Initialize a plugin once, even when called concurrently.
+        
+        Raises:
+            GenAICoreException: If plugin initialization fails
+        """
+        lock = self._init_locks.get(name)
+        if lock is None or name in self._initialized:
+            return
+        with lock:
+            if name in self._initialized:
+                return
+            try:
+                logger.debug("Initializing plugin: %s", name)
+                plugin.initialize(container)
+                logger.debug("Initialized plugin: %s", name)
+            except Exception as e:
+                logger.error("Failed to initialize plugin '%s': %s", name, e, exc_info=True)
+                raise GenAICoreException(
+                    f"Plugin '{name}' initialization failed: {str(e)}"
+                ) from e
+            self._initialized.add(name)
     
     def initialize_all(self, container: ApplicationContainer) -> None:
         """
-        Initialize all registered plugins.
+        Initialize all required plugins.
+        Plugins registered with ``required=False`` are initialized on first use.
         
         Args:
             container: Application container
@@ -88,27 +136,20 @@ class PluginRegistry:
         Raises:
             GenAICoreException: If plugin initialization fails
         """
-        with self._lock:
-            plugins = list(self._plugins.values())
+        self._container = container
+        plugins = [(name, plugin) for name, plugin in self._plugins.items() if name not in self._lazy]
         
-        logger.info(f"Initializing {len(plugins)} plugins")
+        logger.info("Initializing %s plugins", len(plugins))
         
-        for plugin in plugins:
-            try:
-                logger.debug(f"Initializing plugin: {plugin.get_name()}")
-                plugin.initialize(container)
-                logger.debug(f"Initialized plugin: {plugin.get_name()}")
-            except Exception as e:
-                logger.error(f"Failed to initialize plugin '{plugin.get_name()}': {e}", exc_info=True)
-                raise GenAICoreException(
-                    f"Plugin '{plugin.get_name()}' initialization failed: {str(e)}"
-                ) from e
+        for name, plugin in plugins:
+            self._initialize(name, plugin, container)
         
         logger.info("All plugins initialized successfully")
     
     def get_plugin(self, name: str) -> Plugin:
         """
         Get plugin by name.
+        Initializes a lazy plugin on first use once initialize_all() has run.
         
         Args:
             name: Plugin name
@@ -118,14 +159,19 @@ class PluginRegistry:
             
         Raises:
             KeyError: If plugin not found
-        """
-        with self._lock:
-            if name not in self._plugins:
-                available = list(self._plugins.keys())
-                raise KeyError(
-                    f"Plugin '{name}' not found. Available plugins: {available}"
-                )
-            return self._plugins[name]
+            GenAICoreException: If lazy plugin initialization fails
+        """
+        plugins = self._plugins
+        plugin = plugins.get(name)
+        if plugin is None:
+            available = list(plugins.keys())
+            raise KeyError(
+                f"Plugin '{name}' not found. Available plugins: {available}"
+            )
+        container = self._container
+        if container is not None and name not in self._initialized:
+            self._initialize(name, plugin, container)
+        return plugin
     
     def list_plugins(self) -> List[str]:
         """
@@ -134,8 +180,7 @@ class PluginRegistry:
         Returns:
             List of plugin names
         """
-        with self._lock:
-            return list(self._plugins.keys())
+        return list(self._plugins.keys())
     
     def unregister(self, name: str) -> bool:
         """
@@ -149,13 +194,21 @@ class PluginRegistry:
         """
         with self._lock:
             if name in self._plugins:
-                del self._plugins[name]
-                logger.info(f"Unregistered plugin: {name}")
+                plugins = dict(self._plugins)
+                del plugins[name]
+                self._plugins = plugins
+                self._lazy.discard(name)
+                self._initialized.discard(name)
+                self._init_locks.pop(name, None)
+                logger.info("Unregistered plugin: %s", name)
                 return True
             return False
     
     def clear(self) -> None:
         """Clear all registered plugins."""
         with self._lock:
-            self._plugins.clear()
+            self._plugins = {}
+            self._lazy.clear()
+            self._initialized.clear()
+            self._init_locks.clear()
             logger.info("Cleared plugin registry")
@@ -171,9 +171,6 @@ class SessionManager:
                 ttl_seconds = int(self.session_timeout.total_seconds())
                 self._storage.save_session(session_id, session_data, ttl_seconds)
                 
-                # Increment session count
-                self._storage.increment_session_count()
-                
                 logger.info(
                     f"Created new session {session_id} (user_id={user_id})"
                 )
@@ -201,8 +198,6 @@ class SessionManager:
                 if session.is_expired(self.session_timeout):
                     # Delete expired session
                     self._storage.delete_session(session_id)
-                    # Decrement session count
-                    self._storage.decrement_session_count()
                     logger.info(f"Removed expired session {session_id}")
                     return None
                 return session
@@ -297,8 +292,6 @@ class SessionManager:
         try:
             deleted = self._storage.delete_session(session_id)
             if deleted:
-                # Decrement session count
-                self._storage.decrement_session_count()
                 logger.info(f"Deleted session {session_id}")
             return deleted
         except Exception as e:
@@ -330,8 +323,6 @@ class SessionManager:
                         session = self._dict_to_session(session_data)
                         if session.is_expired(self.session_timeout):
                             self._storage.delete_session(session_id)
-                            # Decrement session count
-                            self._storage.decrement_session_count()
                             expired_count += 1
                 except Exception as e:
                     logger.warning(f"Error checking session expiration for {key}: {e}")
@@ -355,9 +346,8 @@ class SessionManager:
     
     def _get_session_count(self) -> int:
         """
-        Get current number of active sessions using storage counter.
-        Note: Counter may drift slightly if sessions expire via TTL without going through
-        our delete methods, but this is acceptable for performance.
+        Get current number of stored sessions.
+        Sessions that expired but were not yet removed are still counted.
         """
         try:
             return self._storage.get_session_count()
@@ -7,14 +7,9 @@ interface and provide your own Redis or database-backed implementation.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Any, Iterable, Optional
-from threading import Lock
-
-
-@dataclass
-class _SessionRecord:
-    data: Dict[str, Any]
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Mapping, Optional
+import warnings
 
 
 class SessionStorage:
@@ -24,54 +19,66 @@ class SessionStorage:
     This mirrors the minimal API expected by ``ChatbotSessionManager`` without
     introducing external dependencies. It is intentionally lightweight and is
     suitable for single-process applications and tests.
+
+    Every operation is a single dict operation, which is atomic in CPython,
+    so no lock is needed. The session count is the size of the dict.
     """
 
     def __init__(self) -> None:
-        self._sessions: Dict[str, _SessionRecord] = {}
-        self._count: int = 0
-        self._lock = Lock()
+        self._sessions: Dict[str, Dict[str, Any]] = {}
 
     # Core CRUD operations -------------------------------------------------
 
-    def save_session(self, session_id: str, data: Dict[str, Any], ttl_seconds: int) -> None:
+    def save_session(self, session_id: str, data: Mapping[str, Any], ttl_seconds: int) -> None:
         """Save or update session data. ``ttl_seconds`` is accepted but ignored in-memory."""
-        with self._lock:
-            self._sessions[session_id] = _SessionRecord(data=data)
+        # Copied once here so the stored dict is private and reads can share it
+        self._sessions[session_id] = dict(data)
 
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session data by ID."""
-        with self._lock:
-            record = self._sessions.get(session_id)
-            return dict(record.data) if record else None
+    def get_session(self, session_id: str) -> Optional[Mapping[str, Any]]:
+        """Get a read-only view of session data by ID (no copy)."""
+        data = self._sessions.get(session_id)
+        return MappingProxyType(data) if data is not None else None
+
+    def get_session_mutable(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of session data by ID that the caller may modify."""
+        data = self._sessions.get(session_id)
+        return dict(data) if data is not None else None
 
     def delete_session(self, session_id: str) -> bool:
         """Delete session by ID. Returns True if it existed."""
-        with self._lock:
-            existed = session_id in self._sessions
-            self._sessions.pop(session_id, None)
-            return existed
+        return self._sessions.pop(session_id, None) is not None
+
+    def clear_all(self) -> None:
+        """Delete all sessions."""
+        self._sessions.clear()
 
     # Session count helpers ------------------------------------------------
 
+    def get_session_count(self) -> int:
+        """Return the number of stored sessions."""
+        return len(self._sessions)
+
     def increment_session_count(self) -> None:
-        with self._lock:
-            self._count += 1
+        """Deprecated no-op: the count is derived from the stored sessions."""
+        warnings.warn(
+            "SessionStorage.increment_session_count() is deprecated and does nothing",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
     def decrement_session_count(self) -> None:
-        with self._lock:
-            if self._count > 0:
-                self._count -= 1
-
-    def get_session_count(self) -> int:
-        with self._lock:
-            return self._count
+        """Deprecated no-op: the count is derived from the stored sessions."""
+        warnings.warn(
+            "SessionStorage.decrement_session_count() is deprecated and does nothing",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
     # Scanning helpers -----------------------------------------------------
 
     def scan_sessions(self) -> Iterable[str]:
         """Return iterable of internal session keys."""
-        with self._lock:
-            return list(self._sessions.keys())
+        return list(self._sessions)
 
     def extract_session_id_from_key(self, key: str) -> str:
         """For compatibility with Redis-style keys; here key is already the ID."""
@@ -1,35 +1,154 @@
 """
 In-memory storage implementation.
 """
-from typing import Any, Optional, List, Dict
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Optional, List, Dict, Tuple, Literal
 from threading import Lock
-from datetime import datetime, timedelta
+import fnmatch
+import heapq
+import random
+import re
+import time
 
 from .storage_backend import StorageBackend
 from ..config.logging_config import logger
+from ..exceptions import StorageBackendError
+
+
+EvictionPolicy = Literal["noeviction", "allkeys-lru", "allkeys-random", "volatile-ttl"]
+_EVICTION_POLICIES = ("noeviction", "allkeys-lru", "allkeys-random", "volatile-ttl")
+
+# Every _SWEEP_INTERVAL-th get/exists also evicts up to _SWEEP_LIMIT expired keys
+_SWEEP_INTERVAL = 64
+_SWEEP_LIMIT = 5
 
 
 class InMemoryStorage(StorageBackend):
     """
     In-memory storage backend.
     Suitable for single-process applications and testing.
+    
+    Expiry times are also kept in a min-heap, so removing expired keys only
+    touches keys that have actually expired. Heap entries made stale by a
+    later set() or delete() are skipped when popped. Reads periodically
+    evict a few expired keys too, so keys that expire without being read
+    again do not pile up between keys() calls.
+    
+    With ``max_entries`` set, adding a key to a full store first drops
+    expired keys, then evicts one key by ``eviction_policy`` (named after
+    the Redis policies):
+        - ``allkeys-lru``: least recently read or written key
+        - ``allkeys-random``: a random key
+        - ``volatile-ttl``: the key with a TTL that expires soonest
+        - ``noeviction``: nothing; the set() fails instead
     """
     
-    def __init__(self):
-        self._data: Dict[str, Any] = {}
-        self._ttls: Dict[str, datetime] = {}
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        eviction_policy: EvictionPolicy = "allkeys-lru"
+    ):
+        """
+        Initialize in-memory storage.
+        
+        Args:
+            max_entries: Maximum number of keys (None for unlimited)
+            eviction_policy: Which key to evict when max_entries is reached
+        
+        Raises:
+            ValueError: If max_entries or eviction_policy is invalid
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if eviction_policy not in _EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy '{eviction_policy}'. "
+                f"Available policies: {', '.join(_EVICTION_POLICIES)}"
+            )
+        self._max_entries = max_entries
+        self._eviction_policy = eviction_policy
+        # Kept in recency order when evicting by LRU
+        self._lru = max_entries is not None and eviction_policy == "allkeys-lru"
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        # Expiry as time.monotonic_ns() deadlines
+        self._ttls: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[int, str]] = []
+        self._reads = 0
         self._lock = Lock()
     
+    def _evict_expired(self, now: int, limit: Optional[int] = None) -> None:
+        """
+        Remove expired keys from the head of the expiry heap. Caller holds the lock.
+        
+        Args:
+            now: Current time.monotonic_ns() value
+            limit: Maximum number of heap entries to pop (None for all expired)
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now and limit != 0:
+            expiry, key = heapq.heappop(heap)
+            # Skip entries superseded by a later set() or delete()
+            if self._ttls.get(key) == expiry:
+                del self._data[key]
+                del self._ttls[key]
+            if limit is not None:
+                limit -= 1
+    
+    def _is_expired(self, key: str) -> bool:
+        """Check and remove a single expired key, sweeping a few others now and then. Caller holds the lock."""
+        now = time.monotonic_ns()
+        self._reads += 1
+        if self._reads % _SWEEP_INTERVAL == 0:
+            self._evict_expired(now, _SWEEP_LIMIT)
+        expiry = self._ttls.get(key)
+        if expiry is not None and now > expiry:
+            del self._data[key]
+            del self._ttls[key]
+            return True
+        return False
+    
+    def _make_room(self) -> None:
+        """
+        Free one slot for a new key. Caller holds the lock.
+        
+        Raises:
+            StorageBackendError: If the policy does not allow evicting a key
+        """
+        self._evict_expired(time.monotonic_ns())
+        if len(self._data) < self._max_entries:
+            return
+        
+        if self._eviction_policy == "allkeys-lru":
+            key, _ = self._data.popitem(last=False)
+            self._ttls.pop(key, None)
+        elif self._eviction_policy == "allkeys-random":
+            key = next(islice(self._data, random.randrange(len(self._data)), None))
+            del self._data[key]
+            self._ttls.pop(key, None)
+        elif self._eviction_policy == "volatile-ttl":
+            heap = self._expiry_heap
+            while heap:
+                expiry, key = heapq.heappop(heap)
+                if self._ttls.get(key) == expiry:
+                    del self._data[key]
+                    del self._ttls[key]
+                    break
+            else:
+                raise StorageBackendError(
+                    f"InMemoryStorage is full ({self._max_entries} entries) and no key has a TTL to evict"
+                )
+        else:
+            raise StorageBackendError(f"InMemoryStorage is full ({self._max_entries} entries)")
+        logger.debug("Evicted key %s (%s)", key, self._eviction_policy)
+    
     async def get(self, key: str) -> Optional[Any]:
         """Get value by key."""
         with self._lock:
-            # Check if expired
-            if key in self._ttls:
-                if datetime.now() > self._ttls[key]:
-                    del self._data[key]
-                    del self._ttls[key]
-                    return None
-            
+            if self._is_expired(key):
+                return None
+            if self._lru and key in self._data:
+                self._data.move_to_end(key)
             return self._data.get(key)
     
     async def set(
@@ -38,11 +157,26 @@ class InMemoryStorage(StorageBackend):
         value: Any,
         ttl: Optional[int] = None
     ) -> None:
-        """Set value with optional TTL."""
+        """
+        Set value with optional TTL.
+        
+        Raises:
+            StorageBackendError: If the store is full and nothing can be evicted
+        """
         with self._lock:
+            if self._max_entries is not None and key not in self._data and len(self._data) >= self._max_entries:
+                self._make_room()
             self._data[key] = value
+            if self._lru:
+                self._data.move_to_end(key)
             if ttl:
-                self._ttls[key] = datetime.now() + timedelta(seconds=ttl)
+                expiry = time.monotonic_ns() + int(ttl * 1_000_000_000)
+                self._ttls[key] = expiry
+                heapq.heappush(self._expiry_heap, (expiry, key))
+                # Rebuild when stale entries from overwritten keys dominate
+                if len(self._expiry_heap) > 2 * len(self._ttls) + 64:
+                    self._expiry_heap = [(expiry, k) for k, expiry in self._ttls.items()]
+                    heapq.heapify(self._expiry_heap)
             elif key in self._ttls:
                 del self._ttls[key]
     
@@ -57,30 +191,21 @@ class InMemoryStorage(StorageBackend):
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
         with self._lock:
-            # Check if expired
-            if key in self._ttls:
-                if datetime.now() > self._ttls[key]:
-                    del self._data[key]
-                    del self._ttls[key]
-                    return False
+            if self._is_expired(key):
+                return False
             return key in self._data
     
     async def keys(self, pattern: Optional[str] = None) -> List[str]:
         """Get all keys, optionally filtered by pattern."""
         with self._lock:
-            # Clean up expired keys
-            now = datetime.now()
-            expired = [k for k, expiry in self._ttls.items() if now > expiry]
-            for key in expired:
-                self._data.pop(key, None)
-                self._ttls.pop(key, None)
+            self._evict_expired(time.monotonic_ns())
             
             all_keys = list(self._data.keys())
             
             if pattern:
-                # Simple pattern matching (supports * wildcard)
-                import fnmatch
-                return [k for k in all_keys if fnmatch.fnmatch(k, pattern)]
+                # Simple pattern matching (supports * wildcard), compiled once
+                match = re.compile(fnmatch.translate(pattern)).match
+                return [k for k in all_keys if match(k)]
             
             return all_keys
     
@@ -89,4 +214,5 @@ class InMemoryStorage(StorageBackend):
         with self._lock:
             self._data.clear()
             self._ttls.clear()
+            self._expiry_heap.clear()
             logger.info("Cleared in-memory storage")
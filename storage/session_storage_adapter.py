@@ -1,7 +1,9 @@
 """
 Adapter to make SessionStorage compatible with StorageBackend interface.
 """
-from typing import Dict, Any, Iterable, Optional, List
+from typing import Dict, Any, Iterable, Mapping, Optional, List
+import fnmatch
+import re
 
 from ..session.session_storage import SessionStorage
 from .storage_backend import StorageBackend
@@ -23,7 +25,7 @@ class SessionStorageAdapter(StorageBackend):
         self._storage = session_storage or SessionStorage()
     
     async def get(self, key: str) -> Optional[Any]:
-        """Get session data by key."""
+        """Get a read-only view of session data by key."""
         return self._storage.get_session(key)
     
     async def set(
@@ -33,10 +35,10 @@ class SessionStorageAdapter(StorageBackend):
         ttl: Optional[int] = None
     ) -> None:
         """Set session data with optional TTL."""
-        if isinstance(value, dict):
+        if isinstance(value, Mapping):
             self._storage.save_session(key, value, ttl or 0)
         else:
-            raise ValueError("SessionStorage only accepts dict values")
+            raise ValueError("SessionStorage only accepts dict (mapping) values")
     
     async def delete(self, key: str) -> bool:
         """Delete session by key."""
@@ -50,12 +52,10 @@ class SessionStorageAdapter(StorageBackend):
         """Get all session keys."""
         keys = list(self._storage.scan_sessions())
         if pattern:
-            import fnmatch
-            return [k for k in keys if fnmatch.fnmatch(k, pattern)]
+            match = re.compile(fnmatch.translate(pattern)).match
+            return [k for k in keys if match(k)]
         return keys
     
     async def clear(self) -> None:
         """Clear all sessions."""
-        keys = await self.keys()
-        for key in keys:
-            await self.delete(key)
+        self._storage.clear_all()
@@ -8,7 +8,7 @@ import threading
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage
 
-from ..dependencies.application_container import ApplicationContainer
+from ..dependencies.application_container import ApplicationContainer, ContainerService
 from ..llm.llm_manager import LLMManager
 from ..session.session_manager import SessionManager
 from ..memory.memory_manager import MemoryManager, InMemoryMemoryManager
@@ -59,7 +59,7 @@ class TestApplicationContainer(ApplicationContainer):
     
     def __init__(self):
         self._lock = threading.Lock()
-        self._initialized_services = set()
+        self._initialized = ContainerService(0)
         self._test_mode = True
         # Override core dependencies initialization with test versions
         self._initialize_test_core_dependencies()
@@ -69,28 +69,28 @@ class TestApplicationContainer(ApplicationContainer):
         # Initialize test LLM registry (simplified for testing)
         from ..llm.llm_manager import LLMManagerRegistry
         self._llm_registry = LLMManagerRegistry()
-        self._initialized_services.add("llm_registry")
+        self._initialized |= ContainerService.LLM_REGISTRY
         logger.info("Test LLM registry initialized")
         
         # Initialize test LLM manager
         self._llm_manager = TestLLMManager()
-        self._initialized_services.add("llm_manager")
+        self._initialized |= ContainerService.LLM_MANAGER
         logger.info("Test LLM manager initialized")
         
         # Initialize test session manager
         self._session_manager = TestSessionManager()
-        self._initialized_services.add("session_manager")
+        self._initialized |= ContainerService.SESSION_MANAGER
         logger.info("Test session manager initialized")
         
         # Initialize test memory manager
         self._memory_manager = TestMemoryManager()
-        self._initialized_services.add("memory_manager")
+        self._initialized |= ContainerService.MEMORY_MANAGER
         logger.info("Test memory manager initialized")
         
         # Initialize test agent factory
         from ..agents.agent_factory import DefaultAgentFactory
         self._agent_factory = DefaultAgentFactory()
-        self._initialized_services.add("agent_factory")
+        self._initialized |= ContainerService.AGENT_FACTORY
         logger.info("Test agent factory initialized")
         
         logger.info("Test core dependencies initialized")
@@ -100,7 +100,7 @@ class TestApplicationContainer(ApplicationContainer):
         Optional: Pre-initialize optional test dependencies.
         Core dependencies are already initialized in __init__.
         """
-        logger.info(f"Test application container initialized: {self._initialized_services}")
+        logger.info(f"Test application container initialized: {self.get_initialized_services()}")
 
 
 # Pytest-style fixtures (can be used with pytest or manually)
@@ -1,6 +1,7 @@
 """
 Tool registry for managing and accessing agent tools.
 """
+from operator import itemgetter
 from typing import Dict, List, Optional
 from threading import Lock
 
@@ -14,6 +15,10 @@ class ToolRegistry:
     """
     Registry for managing agent tools.
     Provides thread-safe access to registered tools.
+    
+    Writes replace ``_tools`` with an updated copy under the lock, and the
+    dict is never mutated in place, so reads use the current reference
+    without locking.
     """
     
     def __init__(self):
@@ -30,9 +35,9 @@ class ToolRegistry:
         """
         with self._lock:
             if name in self._tools:
-                logger.warning(f"Tool '{name}' already registered, overwriting")
-            self._tools[name] = tool
-            logger.info(f"Registered tool: {name}")
+                logger.warning("Tool '%s' already registered, overwriting", name)
+            self._tools = {**self._tools, name: tool}
+            logger.info("Registered tool: %s", name)
     
     def register_many(self, tools: Dict[str, BaseTool]) -> None:
         """
@@ -42,9 +47,8 @@ class ToolRegistry:
             tools: Dictionary mapping tool names to tool instances
         """
         with self._lock:
-            for name, tool in tools.items():
-                self._tools[name] = tool
-            logger.info(f"Registered {len(tools)} tools")
+            self._tools = {**self._tools, **tools}
+            logger.info("Registered %s tools", len(tools))
     
     def get_tool(self, name: str) -> BaseTool:
         """
@@ -59,13 +63,14 @@ class ToolRegistry:
         Raises:
             ToolNotFoundError: If tool is not found
         """
-        with self._lock:
-            if name not in self._tools:
-                available = list(self._tools.keys())
-                raise ToolNotFoundError(
-                    f"Tool '{name}' not found. Available tools: {available}"
-                )
-            return self._tools[name]
+        registered = self._tools
+        tool = registered.get(name)
+        if tool is None:
+            available = list(registered.keys())
+            raise ToolNotFoundError(
+                f"Tool '{name}' not found. Available tools: {available}"
+            )
+        return tool
     
     def get_tools(self, names: Optional[List[str]] = None) -> List[BaseTool]:
         """
@@ -77,17 +82,27 @@ class ToolRegistry:
         Returns:
             List of tool instances
         """
-        with self._lock:
-            if names is None:
-                return list(self._tools.values())
-            
-            tools = []
-            for name in names:
-                if name in self._tools:
-                    tools.append(self._tools[name])
-                else:
-                    logger.warning(f"Tool '{name}' not found, skipping")
-            return tools
+        registered = self._tools
+        if names is None:
+            return list(registered.values())
+        if not names:
+            return []
+        
+        # Fast path: every name is registered
+        try:
+            found = itemgetter(*names)(registered)
+        except KeyError:
+            pass
+        else:
+            return [found] if len(names) == 1 else list(found)
+        
+        tools = []
+        for name in names:
+            if name in registered:
+                tools.append(registered[name])
+            else:
+                logger.warning("Tool '%s' not found, skipping", name)
+        return tools
     
     def list_tools(self) -> List[str]:
         """
@@ -96,8 +111,7 @@ class ToolRegistry:
         Returns:
             List of tool names
         """
-        with self._lock:
-            return list(self._tools.keys())
+        return list(self._tools.keys())
     
     def unregister(self, name: str) -> bool:
         """
@@ -111,13 +125,15 @@ class ToolRegistry:
         """
         with self._lock:
             if name in self._tools:
-                del self._tools[name]
-                logger.info(f"Unregistered tool: {name}")
+                tools = dict(self._tools)
+                del tools[name]
+                self._tools = tools
+                logger.info("Unregistered tool: %s", name)
                 return True
             return False
     
     def clear(self) -> None:
         """Clear all registered tools."""
         with self._lock:
-            self._tools.clear()
+            self._tools = {}
             logger.info("Cleared tool registry")
@@ -5,8 +5,16 @@ Supports multiple tokenization methods and provides cost estimation.
 This module is packaged as part of ``gen_ai_core_lib`` and uses
 package-relative imports only.
 """
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from threading import Lock
+import hashlib
+import logging
+import os
 
 try:
     import tiktoken
@@ -14,17 +22,146 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .._compat import DATACLASS_SLOTS
 from ..config.logging_config import logger
+from ..config.settings import settings
+
+
+# Map model names to tiktoken encodings
+_ENCODING_MAP = {
+    "gpt-4": "cl100k_base",
+    "gpt-4-turbo": "cl100k_base",
+    "gpt-4o": "o200k_base",
+    "gpt-3.5-turbo": "cl100k_base",
+}
+
+
+@lru_cache(maxsize=32)
+def _get_encoding_cached(encoding_name: str) -> "tiktoken.Encoding":
+    """Load a tiktoken encoding once per process; loading parses the whole BPE vocabulary."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+# Token counts are memoized per (encoding, text). Texts longer than
+# _LONG_TEXT_CHARS are keyed by a digest so the cache never holds them.
+# Repeated system prompts and context chunks are counted once per process.
+_ENCODE_CACHE_SIZE = max(0, settings.TOKEN_COUNT_CACHE_SIZE)
+_LONG_TEXT_CHARS = 8192
+_LONG_TEXT_CACHE_SIZE = _ENCODE_CACHE_SIZE // 16
+_long_text_counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+_long_text_lock = Lock()
+
+
+@lru_cache(maxsize=_ENCODE_CACHE_SIZE)
+def _encode_len(encoding_name: str, text: str) -> int:
+    """Count tokens in a short text."""
+    return len(_get_encoding_cached(encoding_name).encode_ordinary(text))
+
+
+def _count_encoded(encoding_name: str, text: str) -> int:
+    """Count tokens with the named encoding, reusing earlier counts of the same text."""
+    if len(text) <= _LONG_TEXT_CHARS:
+        return _encode_len(encoding_name, text)
+    
+    key = (encoding_name, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _long_text_lock:
+        tokens = _long_text_counts.get(key)
+        if tokens is not None:
+            _long_text_counts.move_to_end(key)
+            return tokens
+    tokens = len(_get_encoding_cached(encoding_name).encode_ordinary(text))
+    with _long_text_lock:
+        _long_text_counts[key] = tokens
+        if len(_long_text_counts) > _LONG_TEXT_CACHE_SIZE:
+            _long_text_counts.popitem(last=False)
+    return tokens
+
+
+def _match_pricing(pricing_table: Dict[str, Dict[str, float]], model: str) -> Optional[Dict[str, float]]:
+    """
+    Find pricing for a lowercased model name.
+    
+    Prefers an exact key, then the longest key contained in the model name
+    (so "gpt-4o-mini" gets "gpt-4o", not "gpt-4"), then a key containing it.
+    """
+    pricing = pricing_table.get(model)
+    if pricing is not None:
+        return pricing
+    contained = [key for key in pricing_table if key in model]
+    if contained:
+        return pricing_table[max(contained, key=len)]
+    for key, value in pricing_table.items():
+        if model in key:
+            return value
+    return None
+
+
+# Content extractor per message type, resolved from the first message of each type
+_EXTRACTORS: Dict[type, Callable[[Any], Any]] = {}
+_get_content = attrgetter("content")
+
+
+def _dict_content(msg: Dict[str, Any]) -> Any:
+    """Content of a dict-format message."""
+    return msg.get("content", "")
+
+
+def _resolve_extractor(msg: Any) -> Callable[[Any], Any]:
+    """Get the content extractor for a message's type."""
+    msg_type = type(msg)
+    extractor = _EXTRACTORS.get(msg_type)
+    if extractor is None:
+        if hasattr(msg, "content"):
+            extractor = _get_content
+        elif isinstance(msg, dict):
+            extractor = _dict_content
+        else:
+            extractor = str
+        _EXTRACTORS[msg_type] = extractor
+    return extractor
+
+
+# Message lists at least this long are counted on a shared thread pool;
+# tiktoken releases the GIL while encoding, so the threads run in parallel
+_PARALLEL_MIN_PARTS = 4
+_encode_pool: Optional[ThreadPoolExecutor] = None
+_encode_pool_lock = Lock()
+
+
+def _get_encode_pool() -> ThreadPoolExecutor:
+    """Get the shared encoding thread pool, creating it on first use."""
+    global _encode_pool
+    if _encode_pool is None:
+        with _encode_pool_lock:
+            if _encode_pool is None:
+                _encode_pool = ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 2),
+                    thread_name_prefix="token-counter"
+                )
+    return _encode_pool
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def _lower(name: str) -> str:
+    """Lowercase a model name passed per call."""
+    return name.lower()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TokenCount:
     """Token count information for a component."""
     component: str
-    text: str
+    text: Optional[str]  # None unless the counter was asked to store it
     tokens: int
     characters: int
     estimated_cost_usd: Optional[float] = None
+    bytes: Optional[int] = None  # UTF-8 length, set when counted with unit="bytes"
 
 
 class TokenCounter:
@@ -49,7 +186,7 @@ class TokenCounter:
     }
     
     # Pricing per 1M tokens (as of 2024, approximate - update as needed)
-    # Format: {model_name: {"input": price, "output": price}}
+    # Format: {model_name: {"input": price, "output": price}}; keys are lowercase
     PRICING = {
         "gpt-4": {"input": 30.0, "output": 60.0},
         "gpt-4-turbo": {"input": 10.0, "output": 30.0},
@@ -71,7 +208,15 @@ class TokenCounter:
                        If None, uses default estimation
         """
         self.model_name = model_name or "default"
+        self._model_name_lower = self.model_name.lower()
         self._encoding = None
+        self._encoding_name: Optional[str] = None
+        # TOKEN_RATIOS values are tokens per character
+        self._tokens_per_char = self.TOKEN_RATIOS.get(self._model_name_lower, self.TOKEN_RATIOS["default"])
+        # The ratio never changes, so bind an estimator with it baked in
+        # (unless a subclass overrides _estimate_tokens)
+        if type(self)._estimate_tokens is TokenCounter._estimate_tokens:
+            self._estimate_tokens = lambda text, _k=self._tokens_per_char: int(len(text) * _k)
         
         # Try to get encoding for the model
         if TIKTOKEN_AVAILABLE and model_name:
@@ -80,58 +225,99 @@ class TokenCounter:
     def _try_load_encoding(self, model_name: str) -> None:
         """Try to load tiktoken encoding for the model."""
         try:
-            # Map model names to tiktoken encodings
-            encoding_map = {
-                "gpt-4": "cl100k_base",
-                "gpt-4-turbo": "cl100k_base",
-                "gpt-4o": "o200k_base",
-                "gpt-3.5-turbo": "cl100k_base",
-            }
-            
-            encoding_name = encoding_map.get(model_name.lower())
+            encoding_name = _ENCODING_MAP.get(model_name.lower())
             if encoding_name:
-                self._encoding = tiktoken.get_encoding(encoding_name)
+                self._encoding = _get_encoding_cached(encoding_name)
+                self._encoding_name = encoding_name
                 logger.debug(f"Loaded tiktoken encoding '{encoding_name}' for model '{model_name}'")
         except Exception as e:
             logger.debug(f"Could not load tiktoken encoding for {model_name}: {e}. Using estimation.")
     
-    def count_tokens(self, text: str, component_name: str = "text") -> TokenCount:
+    def count_tokens(
+        self,
+        text: str,
+        component_name: str = "text",
+        store_text: bool = False,
+        unit: Literal["chars", "bytes"] = "chars"
+    ) -> TokenCount:
         """
         Count tokens in text.
         
         Args:
             text: Text to count tokens for
             component_name: Name of the component (for logging)
+            store_text: Keep the text on the result (default: only its length)
+            unit: "bytes" also records the UTF-8 byte length on the result
         
         Returns:
             TokenCount object with token and character counts
+        
+        Raises:
+            ValueError: If unit is not "chars" or "bytes"
         """
-        if not text:
-            return TokenCount(
-                component=component_name,
-                text="",
-                tokens=0,
-                characters=0
-            )
+        if unit == "chars":
+            size = None
+        elif unit == "bytes":
+            size = len(text.encode("utf-8")) if text else 0
+        else:
+            raise ValueError(f"Unknown unit '{unit}'. Available units: chars, bytes")
+        return TokenCount(
+            component=component_name,
+            text=text if store_text else None,
+            tokens=self.count_tokens_fast(text),
+            characters=len(text) if text else 0,
+            bytes=size
+        )
+    
+    def count_tokens_batch(self, texts: List[str], labels: List[str]) -> List[TokenCount]:
+        """
+        Count tokens for several texts in one call.
+        Texts are encoded on the shared thread pool when there are enough of
+        them, and repeated texts hit the memo cache.
+        
+        Args:
+            texts: Texts to count tokens for
+            labels: Component name for each text
+        
+        Returns:
+            One TokenCount per text, in order
+        
+        Raises:
+            ValueError: If texts and labels differ in length
+        """
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+        if self._encoding and len(texts) >= _PARALLEL_MIN_PARTS:
+            counts = _get_encode_pool().map(self.count_tokens_fast, texts)
+        else:
+            counts = map(self.count_tokens_fast, texts)
+        return [
+            TokenCount(label, None, tokens, len(text) if text else 0)
+            for label, text, tokens in zip(labels, texts, counts)
+        ]
+    
+    def count_tokens_fast(self, text: str) -> int:
+        """
+        Count tokens in text without building a TokenCount.
+        Special-token markers such as ``<|endoftext|>`` are counted as
+        ordinary text (tiktoken ``encode_ordinary``), never as special tokens.
+        
+        Args:
+            text: Text to count tokens for
         
-        characters = len(text)
+        Returns:
+            Token count
+        """
+        if not text:
+            return 0
         
         # Use tiktoken if available and encoding is loaded
         if self._encoding:
             try:
-                tokens = len(self._encoding.encode(text))
+                return _count_encoded(self._encoding_name, text)
             except Exception as e:
                 logger.debug(f"Error encoding with tiktoken: {e}. Using estimation.")
-                tokens = self._estimate_tokens(text)
-        else:
-            tokens = self._estimate_tokens(text)
-        
-        return TokenCount(
-            component=component_name,
-            text=text,
-            tokens=tokens,
-            characters=characters
-        )
+        return self._estimate_tokens(text)
     
     def _estimate_tokens(self, text: str) -> int:
         """
@@ -143,11 +329,29 @@ class TokenCounter:
         Returns:
             Estimated token count
         """
-        ratio = self.TOKEN_RATIOS.get(self.model_name.lower(), self.TOKEN_RATIOS["default"])
-        # tokens = characters / chars_per_token
-        # chars_per_token = 1 / ratio
-        chars_per_token = 1 / ratio
-        return int(len(text) / chars_per_token)
+        return int(len(text) * self._tokens_per_char)
+    
+    def estimate_tokens_batch(self, texts: List[str]) -> "np.ndarray":
+        """
+        Estimate token counts for many texts at once from their lengths.
+        Uses the same character ratio as the fallback estimation, never tiktoken.
+        
+        Args:
+            texts: Texts to estimate tokens for
+        
+        Returns:
+            int64 array of estimated token counts, one per text
+        
+        Raises:
+            ValueError: If numpy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ValueError(
+                "estimate_tokens_batch requires the 'numpy' package. "
+                "Please install it using: pip install numpy"
+            )
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        return (lengths * self._tokens_per_char).astype(np.int64)
     
     def estimate_cost(
         self,
@@ -166,14 +370,13 @@ class TokenCounter:
         Returns:
             Estimated cost in USD
         """
-        model = (model_name or self.model_name).lower()
+        model = _lower(model_name) if model_name else self._model_name_lower
         
-        # Try to find matching pricing
-        pricing = None
-        for key, value in self.PRICING.items():
-            if key.lower() in model or model in key.lower():
-                pricing = value
-                break
+        # Matches against the built-in table are resolved once per model name
+        if self.PRICING is TokenCounter.PRICING:
+            pricing = _resolve_default_pricing(model)
+        else:
+            pricing = _match_pricing(self.PRICING, model)
         
         if not pricing:
             logger.debug(f"No pricing found for model '{model}'. Cost estimation unavailable.")
@@ -184,46 +387,63 @@ class TokenCounter:
         
         return input_cost + output_cost
     
-    def count_messages_tokens(self, messages: List[Any], component_name: str = "messages") -> TokenCount:
+    def count_messages_tokens(
+        self,
+        messages: List[Any],
+        component_name: str = "messages",
+        store_text: bool = False
+    ) -> TokenCount:
         """
         Count tokens in a list of messages (LangChain message format).
         
         Args:
             messages: List of message objects (HumanMessage, AIMessage, etc.)
             component_name: Name of the component
+            store_text: Keep the newline-joined message text on the result
         
         Returns:
             TokenCount object
         """
         if not messages:
-            return TokenCount(
-                component=component_name,
-                text="",
-                tokens=0,
-                characters=0
-            )
+            return TokenCount(component_name, "" if store_text else None, 0, 0)
         
-        total_text = ""
-        for msg in messages:
-            # Handle different message formats
-            if hasattr(msg, 'content'):
-                content = msg.content
-            elif isinstance(msg, dict):
-                content = msg.get('content', '')
-            else:
-                content = str(msg)
-            
+        # One entry per message/content block
+        parts: List[str] = []
+        for content in [_resolve_extractor(msg)(msg) for msg in messages]:
             if isinstance(content, str):
-                total_text += content + "\n"
+                parts.append(content)
             elif isinstance(content, list):
                 # Handle list content (e.g., Gemini format)
                 for block in content:
                     if isinstance(block, dict) and 'text' in block:
-                        total_text += block['text'] + "\n"
+                        parts.append(block['text'])
                     else:
-                        total_text += str(block) + "\n"
+                        parts.append(str(block))
+        
+        # Length of the parts joined with a trailing newline after each
+        characters = sum(map(len, parts)) + len(parts)
+        tokens = None
+        if self._encoding:
+            # Per-part counts hit the memo cache for messages already seen
+            count = partial(_count_encoded, self._encoding_name)
+            try:
+                if len(parts) >= _PARALLEL_MIN_PARTS:
+                    counts = _get_encode_pool().map(count, parts)
+                else:
+                    counts = map(count, parts)
+                # Plus one token per newline separator
+                tokens = sum(counts) + len(parts)
+            except Exception as e:
+                logger.debug(f"Error batch encoding with tiktoken: {e}. Using estimation.")
+        if tokens is None:
+            tokens = int(characters * self._tokens_per_char)
         
-        return self.count_tokens(total_text, component_name)
+        return TokenCount(
+            component=component_name,
+            text=("\n".join(parts) + "\n" if parts else "") if store_text else None,
+            tokens=tokens,
+            characters=characters
+        )
     
     def log_token_breakdown(
         self,
@@ -241,36 +461,66 @@ class TokenCounter:
             total_output_tokens: Total output tokens from LLM
             model_name: Model name for cost estimation
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         model = model_name or self.model_name
         total_cost = self.estimate_cost(total_input_tokens, total_output_tokens, model)
         
-        logger.info("=" * 80)
-        logger.info(f"TOKEN USAGE BREAKDOWN (Model: {model})")
-        logger.info("=" * 80)
+        # Built as one message so the breakdown is a single log record
+        lines = [
+            "=" * 80,
+            f"TOKEN USAGE BREAKDOWN (Model: {model})",
+            "=" * 80,
+        ]
         
-        for comp in components:
-            percentage = (comp.tokens / total_input_tokens * 100) if total_input_tokens > 0 else 0
-            logger.info(
-                f"  {comp.component:30s}: {comp.tokens:6d} tokens "
-                f"({comp.characters:6d} chars, {percentage:5.1f}% of input)"
-            )
+        inv_total = (100.0 / total_input_tokens) if total_input_tokens > 0 else 0.0
+        lines.extend(
+            f"  {comp.component:30s}: {comp.tokens:6d} tokens "
+            f"({comp.characters:6d} chars, {comp.tokens * inv_total:5.1f}% of input)"
+            for comp in components
+        )
         
-        logger.info("-" * 80)
-        logger.info(f"  {'Total Input Tokens':30s}: {total_input_tokens:6d} tokens")
-        logger.info(f"  {'Total Output Tokens':30s}: {total_output_tokens:6d} tokens")
-        logger.info(f"  {'Total Tokens':30s}: {total_input_tokens + total_output_tokens:6d} tokens")
-        logger.info(f"  {'Estimated Cost (USD)':30s}: ${total_cost:.6f}")
-        logger.info("=" * 80)
+        lines += [
+            "-" * 80,
+            f"  {'Total Input Tokens':30s}: {total_input_tokens:6d} tokens",
+            f"  {'Total Output Tokens':30s}: {total_output_tokens:6d} tokens",
+            f"  {'Total Tokens':30s}: {total_input_tokens + total_output_tokens:6d} tokens",
+            f"  {'Estimated Cost (USD)':30s}: ${total_cost:.6f}",
+            "=" * 80,
+        ]
+        logger.info("\n".join(lines))
+
+
+@lru_cache(maxsize=256)
+def _resolve_default_pricing(model: str) -> Optional[Dict[str, float]]:
+    """Resolve pricing from the built-in TokenCounter.PRICING table."""
+    return _match_pricing(TokenCounter.PRICING, model)
 
 
+@lru_cache(maxsize=32)
 def get_token_counter(model_name: Optional[str] = None) -> TokenCounter:
     """
-    Get a TokenCounter instance for the specified model.
+    Get the shared TokenCounter instance for the specified model.
     
     Args:
         model_name: Model name (e.g., "gpt-4", "claude-3-opus")
     
     Returns:
-        TokenCounter instance
+        TokenCounter instance (the same one for repeated calls with a model name)
     """
     return TokenCounter(model_name=model_name)
+
+
+def _prewarm_encodings() -> None:
+    """Load every encoding in _ENCODING_MAP into the shared cache."""
+    for encoding_name in sorted(set(_ENCODING_MAP.values())):
+        try:
+            _get_encoding_cached(encoding_name)
+            logger.debug("Prewarmed tiktoken encoding '%s'", encoding_name)
+        except Exception as e:
+            logger.warning("Could not prewarm tiktoken encoding '%s': %s", encoding_name, e)
+
+
+if TIKTOKEN_AVAILABLE and settings.PREWARM_TIKTOKEN:
+    _prewarm_encodings()
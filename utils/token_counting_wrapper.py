@@ -5,15 +5,22 @@ This module provides optional token counting and logging functionality for
 agents using the observer pattern. It is packaged as part of
 ``gen_ai_core_lib`` and uses only package-relative imports.
 """
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
+import os
+import sys
+import warnings
 
 from langchain_core.messages import ToolMessage
+from .._compat import DATACLASS_SLOTS
 from ..config.logging_config import logger
 from .token_counter import get_token_counter, TokenCount
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChatEvent:
     """Event data passed to token counting observer."""
     event_type: str  # 'query', 'enhanced_query', 'system_prompt', 'history', 'context', 'response'
@@ -21,10 +28,42 @@ class ChatEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Component name per event type; the history component is counted as messages.
+# Interned, so label comparisons against these constants hit the identity fast path.
+_HISTORY_LABEL = sys.intern("Conversation History")
+_RESPONSE_LABEL = sys.intern("Response")
+_EVENT_LABELS = {
+    'query': sys.intern("User Query"),
+    'enhanced_query': sys.intern("Enhanced Query (with topic)"),
+    'system_prompt': sys.intern("System Prompt"),
+    'history': _HISTORY_LABEL,
+    'context': sys.intern("Retrieved Context"),
+    'response': _RESPONSE_LABEL,
+}
+_ORIGINAL_QUERY_LABEL = sys.intern("Original Query (before enhancement)")
+
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+
+@lru_cache(maxsize=8)
+def _env_flag(value: str) -> Optional[bool]:
+    """
+    Parse an ENABLE_TOKEN_COUNTING value; cached per raw value, so env changes still apply.
+    
+    Returns:
+        The flag, or None if the variable is unset or empty
+    """
+    value = value.lower()
+    return value in _TRUE_VALUES if value else None
+
+
 class TokenCountingObserver:
     """
     Observer that counts tokens for different components of an interaction.
     Receives events from the agent and accumulates token counts.
+    
+    Events are buffered and counted together when finalize() is called, so
+    all text components go through a single batched count.
     """
     
     def __init__(self, model_name: Optional[str] = None):
@@ -37,45 +76,83 @@ class TokenCountingObserver:
         self.model_name = model_name or "default"
         self._token_counter = get_token_counter(self.model_name)
         self._components: List[TokenCount] = []
+        # Running split of _components, kept up to date by _add_component()
+        self._input_components: List[TokenCount] = []
+        self._input_tokens = 0
+        self._response_count: Optional[TokenCount] = None
         self._events: List[ChatEvent] = []
+        self._pending: List[ChatEvent] = []
         
     def on_event(self, event: ChatEvent) -> None:
         """
         Handle an event from the agent.
+        The event is counted when finalize() is called.
         
         Args:
             event: ChatEvent with event type and data
         """
         self._events.append(event)
+        self._pending.append(event)
+    
+    def _add_component(self, count: TokenCount) -> None:
+        """Record a component and update the input/output totals."""
+        self._components.append(count)
+        if count.component == _RESPONSE_LABEL:
+            self._response_count = count
+        else:
+            self._input_components.append(count)
+            self._input_tokens += count.tokens
+    
+    def _count_components(self, entries: List[Tuple[str, Any]]) -> List[TokenCount]:
+        """
+        Count (component name, data) entries, all text entries in one batch.
         
-        if event.event_type == 'query':
-            count = self._token_counter.count_tokens(event.data, "User Query")
-            self._components.append(count)
-        elif event.event_type == 'enhanced_query':
-            count = self._token_counter.count_tokens(event.data, "Enhanced Query (with topic)")
-            self._components.append(count)
-            # Also log original if available
-            if 'original_query' in event.metadata:
-                original_count = self._token_counter.count_tokens(
-                    event.metadata['original_query'], 
-                    "Original Query (before enhancement)"
-                )
+        Args:
+            entries: Pairs of component name and text, or message list for history
+        
+        Returns:
+            One TokenCount per entry, in order
+        """
+        text_indexes = [i for i, (label, _) in enumerate(entries) if label != _HISTORY_LABEL]
+        counts = self._token_counter.count_tokens_batch(
+            [entries[i][1] for i in text_indexes],
+            [entries[i][0] for i in text_indexes]
+        )
+        results: List[Optional[TokenCount]] = [None] * len(entries)
+        for i, count in zip(text_indexes, counts):
+            results[i] = count
+        for i, (label, data) in enumerate(entries):
+            if results[i] is None:
+                results[i] = self._token_counter.count_messages_tokens(data, label)
+        return results
+    
+    def _flush_events(self) -> None:
+        """Count buffered events and add them to the components."""
+        if not self._pending:
+            return
+        entries: List[Tuple[str, Any]] = []
+        # Original queries are only logged for comparison, not added as components
+        originals: Dict[int, int] = {}
+        for event in self._pending:
+            label = _EVENT_LABELS.get(event.event_type)
+            if label is None:
+                continue
+            entries.append((label, event.data))
+            if event.event_type == 'enhanced_query' and 'original_query' in event.metadata:
+                originals[len(entries)] = len(entries) - 1
+                entries.append((_ORIGINAL_QUERY_LABEL, event.metadata['original_query']))
+        self._pending.clear()
+        
+        counts = self._count_components(entries)
+        for i, count in enumerate(counts):
+            if i in originals:
+                enhanced_tokens = counts[originals[i]].tokens
                 logger.debug(
-                    f"Query enhanced: {original_count.tokens} -> {count.tokens} tokens "
-                    f"(+{count.tokens - original_count.tokens})"
+                    f"Query enhanced: {count.tokens} -> {enhanced_tokens} tokens "
+                    f"(+{enhanced_tokens - count.tokens})"
                 )
-        elif event.event_type == 'system_prompt':
-            count = self._token_counter.count_tokens(event.data, "System Prompt")
-            self._components.append(count)
-        elif event.event_type == 'history':
-            count = self._token_counter.count_messages_tokens(event.data, "Conversation History")
-            self._components.append(count)
-        elif event.event_type == 'context':
-            count = self._token_counter.count_tokens(event.data, "Retrieved Context")
-            self._components.append(count)
-        elif event.event_type == 'response':
-            count = self._token_counter.count_tokens(event.data, "Response")
-            self._components.append(count)
+            else:
+                self._add_component(count)
     
     def finalize(self, model_name: Optional[str] = None) -> None:
         """
@@ -85,31 +162,24 @@ class TokenCountingObserver:
         Args:
             model_name: Model name for cost estimation (defaults to self.model_name)
         """
-        # Separate response from input components
-        response_count = None
-        input_components = []
-        
-        for comp in self._components:
-            if comp.component == "Response":
-                response_count = comp
-            else:
-                input_components.append(comp)
-        
-        total_input_tokens = sum(comp.tokens for comp in input_components)
-        total_output_tokens = response_count.tokens if response_count else 0
+        self._flush_events()
         
         # Log detailed token breakdown
         self._token_counter.log_token_breakdown(
-            components=input_components,
-            total_input_tokens=total_input_tokens,
-            total_output_tokens=total_output_tokens,
+            components=self._input_components,
+            total_input_tokens=self._input_tokens,
+            total_output_tokens=self._response_count.tokens if self._response_count else 0,
             model_name=model_name or self.model_name
         )
     
     def reset(self) -> None:
         """Reset the observer for a new chat interaction."""
         self._components.clear()
+        self._input_components.clear()
+        self._input_tokens = 0
+        self._response_count = None
         self._events.clear()
+        self._pending.clear()
     
     def process_all_data(
         self,
@@ -117,64 +187,130 @@ class TokenCountingObserver:
         enhanced_query: Optional[str] = None,
         original_query: Optional[str] = None,
         system_prompt: Optional[str] = None,
-        history: Optional[List[Any]] = None,
+        history: Optional[Union[List[Any], Future]] = None,
         context: Optional[str] = None,
         response: Optional[str] = None
     ) -> None:
         """
         Process all token counting data in a single call.
         This is a cleaner alternative to multiple on_event() calls.
+        All text components are counted in one batch.
         
         Args:
             query: Original user query (if not enhanced)
             enhanced_query: Enhanced query with topic guidance
             original_query: Original query before enhancement (for comparison)
             system_prompt: System prompt text
-            history: Conversation history messages
+            history: Conversation history messages, or the pending Future
+                from collect_token_data()
             context: Retrieved context from RAG
             response: Agent response
         """
         # Reset first
         self.reset()
+        history = _resolve_history(history)
         
+        entries: List[Tuple[str, Any]] = []
         # Process query (use enhanced_query if available, otherwise original query)
+        compare_original = False
         if enhanced_query:
-            count = self._token_counter.count_tokens(enhanced_query, "Enhanced Query (with topic)")
-            self._components.append(count)
-            # Also log original if available and different
+            entries.append((_EVENT_LABELS['enhanced_query'], enhanced_query))
+            # Also count original if available and different
             if original_query and original_query != enhanced_query:
-                original_count = self._token_counter.count_tokens(
-                    original_query, 
-                    "Original Query (before enhancement)"
-                )
-                self._components.append(original_count)
-                logger.debug(
-                    f"Query enhanced: {original_count.tokens} -> {count.tokens} tokens "
-                    f"(+{count.tokens - original_count.tokens})"
-                )
+                entries.append((_ORIGINAL_QUERY_LABEL, original_query))
+                compare_original = True
         elif query:
-            count = self._token_counter.count_tokens(query, "User Query")
-            self._components.append(count)
-        
-        # Process system prompt
+            entries.append((_EVENT_LABELS['query'], query))
         if system_prompt:
-            count = self._token_counter.count_tokens(system_prompt, "System Prompt")
-            self._components.append(count)
-        
-        # Process history
+            entries.append((_EVENT_LABELS['system_prompt'], system_prompt))
         if history:
-            count = self._token_counter.count_messages_tokens(history, "Conversation History")
-            self._components.append(count)
-        
-        # Process context
+            entries.append((_EVENT_LABELS['history'], history))
         if context:
-            count = self._token_counter.count_tokens(context, "Retrieved Context")
-            self._components.append(count)
-        
-        # Process response
+            entries.append((_EVENT_LABELS['context'], context))
         if response:
-            count = self._token_counter.count_tokens(response, "Response")
-            self._components.append(count)
+            entries.append((_EVENT_LABELS['response'], response))
+        if not entries:
+            return
+        
+        for count in self._count_components(entries):
+            self._add_component(count)
+        if compare_original:
+            count, original_count = self._components[0], self._components[1]
+            logger.debug(
+                f"Query enhanced: {original_count.tokens} -> {count.tokens} tokens "
+                f"(+{count.tokens - original_count.tokens})"
+            )
+    
+    def process_interaction(
+        self,
+        query: str,
+        enhanced_query: str,
+        thread_id: str,
+        user_id: Optional[str],
+        system_prompt: Optional[str],
+        result: Any,
+        response: str,
+        model_name: Optional[str] = None
+    ) -> None:
+        """
+        Count tokens for a complete chat interaction and log the breakdown.
+        
+        Replaces collect_token_data() + process_token_counting(): history is
+        fetched, context extracted and all components counted in one pass,
+        without building an intermediate token data dict.
+        
+        Args:
+            query: Original user query before any enhancements
+            enhanced_query: Enhanced query (the same as query if no enhancement occurred)
+            thread_id: Thread/session identifier for retrieving conversation history
+            user_id: Optional user identifier for retrieving user-specific history
+            system_prompt: System prompt text
+            result: Agent invocation result containing messages and metadata
+            response: Extracted response text from the agent result
+            model_name: Model name for cost estimation (defaults to self.model_name)
+        """
+        enhanced = enhanced_query != query
+        self.process_all_data(
+            query=None if enhanced else query,
+            enhanced_query=enhanced_query if enhanced else None,
+            original_query=query if enhanced else None,
+            system_prompt=system_prompt,
+            history=_fetch_history(thread_id, user_id),
+            context=extract_context_from_result(result),
+            response=response
+        )
+        self.finalize(model_name=model_name)
+
+
+class _NoopObserver(TokenCountingObserver):
+    """
+    Observer handed out when token counting is disabled.
+    Every method does nothing, and it is falsy so ``if observer:`` checks still skip it.
+    """
+    
+    def __init__(self):
+        self.model_name = "default"
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    def on_event(self, event: ChatEvent) -> None:
+        pass
+    
+    def finalize(self, model_name: Optional[str] = None) -> None:
+        pass
+    
+    def reset(self) -> None:
+        pass
+    
+    def process_all_data(self, *args: Any, **kwargs: Any) -> None:
+        pass
+    
+    def process_interaction(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+_NOOP_OBSERVER = _NoopObserver()
 
 
 class TokenCountingWrapper:
@@ -199,14 +335,15 @@ class TokenCountingWrapper:
             self._observer = TokenCountingObserver(model_name=self.model_name)
             logger.info(f"Token counting enabled for model: {self.model_name}")
     
-    def get_observer(self) -> Optional[TokenCountingObserver]:
+    def get_observer(self) -> TokenCountingObserver:
         """
-        Get the token counting observer if enabled.
+        Get the token counting observer.
         
         Returns:
-            TokenCountingObserver instance if enabled, None otherwise
+            TokenCountingObserver instance if enabled, otherwise a shared
+            no-op observer (falsy) whose methods do nothing
         """
-        return self._observer if self.enabled else None
+        return self._observer if self.enabled and self._observer is not None else _NOOP_OBSERVER
     
     @classmethod
     def create_from_config(
@@ -233,15 +370,14 @@ class TokenCountingWrapper:
                 # Check for token_counting.enabled in config
                 enabled = config_manager.get("token_counting.enabled", default_enabled)
                 if isinstance(enabled, str):
-                    enabled = enabled.lower() in ('true', '1', 'yes', 'on')
+                    enabled = enabled.lower() in _TRUE_VALUES
             except Exception as e:
                 logger.debug(f"Could not read token_counting.enabled from config: {e}")
         
         # Also check environment variable
-        import os
-        env_enabled = os.getenv("ENABLE_TOKEN_COUNTING", "").lower()
-        if env_enabled:
-            enabled = env_enabled in ('true', '1', 'yes', 'on')
+        env_enabled = _env_flag(os.getenv("ENABLE_TOKEN_COUNTING", ""))
+        if env_enabled is not None:
+            enabled = env_enabled
         
         return cls(enabled=enabled, model_name=model_name)
 
@@ -261,19 +397,14 @@ def should_enable_token_counting(config_manager: Optional[Any] = None) -> bool:
         try:
             enabled = config_manager.get("token_counting.enabled", False)
             if isinstance(enabled, str):
-                enabled = enabled.lower() in ('true', '1', 'yes', 'on')
+                enabled = enabled.lower() in _TRUE_VALUES
             if enabled:
                 return True
         except Exception:
             pass
     
     # Check environment variable
-    import os
-    env_enabled = os.getenv("ENABLE_TOKEN_COUNTING", "").lower()
-    if env_enabled:
-        return env_enabled in ('true', '1', 'yes', 'on')
-    
-    return False
+    return bool(_env_flag(os.getenv("ENABLE_TOKEN_COUNTING", "")))
 
 
 def extract_context_from_result(result: Any) -> Optional[str]:
@@ -292,7 +423,8 @@ def extract_context_from_result(result: Any) -> Optional[str]:
                 a list of message objects (HumanMessage, AIMessage, ToolMessage, etc.)
     
     Returns:
-        Context text if found (concatenated if multiple artifacts), None otherwise.
+        Context text from the last tool message that has any (concatenated if
+        multiple artifacts), None otherwise.
         Returns None if no tool messages are found or if context extraction fails.
     
     Example:
@@ -307,45 +439,89 @@ def extract_context_from_result(result: Any) -> Optional[str]:
     """
     try:
         if isinstance(result, dict) and "messages" in result:
-            for msg in result["messages"]:
-                is_tool_message = (
-                    isinstance(msg, ToolMessage) or
-                    (isinstance(msg, dict) and msg.get("type") == "tool")
-                )
-                
-                if not is_tool_message:
-                    continue
-                
-                content = None
-                if hasattr(msg, 'content'):
+            # Tool messages usually come last, so scan from the end
+            for msg in reversed(result["messages"]):
+                msg_type = type(msg)
+                if msg_type is ToolMessage or (msg_type is not dict and isinstance(msg, ToolMessage)):
                     content = msg.content
-                elif isinstance(msg, dict):
+                    if not content:
+                        continue
+                    response_metadata = msg.response_metadata
+                elif isinstance(msg, dict) and msg.get("type") == "tool":
                     content = msg.get('content', '')
+                    if not content:
+                        continue
+                    response_metadata = msg.get('response_metadata', {})
+                else:
+                    continue
                 
-                if content:
-                    response_metadata = None
-                    if hasattr(msg, 'response_metadata'):
-                        response_metadata = msg.response_metadata
-                    elif isinstance(msg, dict):
-                        response_metadata = msg.get('response_metadata', {})
-                    
-                    if response_metadata and 'artifact' in response_metadata:
-                        artifact = response_metadata['artifact']
-                        if isinstance(artifact, list) and artifact:
-                            artifact_content_parts = []
-                            for item in artifact:
-                                if isinstance(item, dict):
-                                    artifact_content_parts.append(item.get('content', ''))
-                            if artifact_content_parts:
-                                return '\n\n'.join(artifact_content_parts)
-                    elif isinstance(content, str) and len(content) > 100:
-                        return content
+                artifact = response_metadata.get('artifact') if response_metadata else None
+                if artifact is not None:
+                    if isinstance(artifact, list):
+                        parts = [item['content'] for item in artifact if isinstance(item, dict) and 'content' in item]
+                        if parts:
+                            return '\n\n'.join(parts)
+                elif isinstance(content, str) and len(content) > 100:
+                    return content
     except Exception as e:
         logger.debug(f"Could not extract retrieved context for token counting: {e}")
     
     return None
 
 
+def _fetch_history(thread_id: str, user_id: Optional[str]) -> Optional[List[Any]]:
+    """
+    Get conversation history from the checkpointer, if one is available.
+    
+    Args:
+        thread_id: Thread/session identifier
+        user_id: Optional user identifier
+    
+    Returns:
+        History messages, or None if there are none or no checkpointer is available
+    """
+    try:
+        # This import is optional and only required if you integrate with a
+        # checkpointing manager that exposes ``get_checkpointer_manager`` using
+        # the same API. If it is not available, history is simply omitted.
+        from src.infrastructure.storage.checkpointing.manager import get_checkpointer_manager  # type: ignore[import-not-found]
+        checkpointer_manager = get_checkpointer_manager()
+        config = checkpointer_manager.get_config(thread_id, user_id)
+        checkpoint = checkpointer_manager.checkpointer.get(config)
+        if checkpoint and "channel_values" in checkpoint:
+            return checkpoint["channel_values"].get("messages", []) or None
+    except Exception as e:
+        logger.debug(f"Could not retrieve history for token counting: {e}")
+    return None
+
+
+def _resolve_history(history: Any) -> Optional[List[Any]]:
+    """Wait for a history lookup started by collect_token_data(); other values pass through."""
+    if isinstance(history, Future):
+        try:
+            return history.result()
+        except Exception as e:
+            logger.debug("Could not retrieve history for token counting: %s", e)
+            return None
+    return history
+
+
+# Checkpointer history lookups started by collect_token_data() run here,
+# overlapping with the agent invocation
+_history_pool: Optional[ThreadPoolExecutor] = None
+_history_pool_lock = Lock()
+
+
+def _get_history_pool() -> ThreadPoolExecutor:
+    """Get the shared history lookup thread pool, creating it on first use."""
+    global _history_pool
+    if _history_pool is None:
+        with _history_pool_lock:
+            if _history_pool is None:
+                _history_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="token-history")
+    return _history_pool
+
+
 def collect_token_data(
     query: str,
     enhanced_query: str,
@@ -356,12 +532,17 @@ def collect_token_data(
     """
     Collect all token counting data before agent invocation.
     
+    Deprecated: use TokenCountingObserver.process_interaction() instead.
+    
     This function gathers all the input data that will be sent to the LLM, including:
     - User query (original and/or enhanced)
     - System prompt
     - Conversation history from checkpointer
     
     The returned dictionary is used later to count tokens for each component.
+    History is fetched in the background while the agent runs; its Future is
+    resolved by update_token_data_with_result(), process_token_counting()
+    or TokenCountingObserver.process_all_data().
     
     Args:
         query: Original user query before any enhancements
@@ -378,7 +559,7 @@ def collect_token_data(
             'enhanced_query': str or None,      # Enhanced query (if enhancement occurred)
             'original_query': str or None,      # Original query (if enhancement occurred)
             'system_prompt': str or None,       # System prompt text
-            'history': List[Message] or None,   # Conversation history messages
+            'history': Future[List[Message] or None],  # Conversation history messages
             'context': None,                    # Will be filled after agent invocation
             'response': None                    # Will be filled after agent invocation
         }
@@ -394,6 +575,11 @@ def collect_token_data(
         >>> print(token_data['enhanced_query'])
         "[Topic Context: Leave policies]\\n\\nUser Question: What is the leave policy?"
     """
+    warnings.warn(
+        "collect_token_data() is deprecated; use TokenCountingObserver.process_interaction()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     token_data = {
         'query': None,
         'enhanced_query': None,
@@ -404,21 +590,8 @@ def collect_token_data(
         'response': None
     }
     
-    # Get conversation history from checkpointer
-    try:
-        # This import is optional and only required if you integrate with a
-        # checkpointing manager that exposes ``get_checkpointer_manager`` using
-        # the same API. If it is not available, history is simply omitted.
-        from src.infrastructure.storage.checkpointing.manager import get_checkpointer_manager  # type: ignore[import-not-found]
-        checkpointer_manager = get_checkpointer_manager()
-        config = checkpointer_manager.get_config(thread_id, user_id)
-        checkpoint = checkpointer_manager.checkpointer.get(config)
-        if checkpoint and "channel_values" in checkpoint:
-            history_messages = checkpoint["channel_values"].get("messages", [])
-            if history_messages:
-                token_data['history'] = history_messages
-    except Exception as e:
-        logger.debug(f"Could not retrieve history for token counting: {e}")
+    # Get conversation history from checkpointer without blocking the caller
+    token_data['history'] = _get_history_pool().submit(_fetch_history, thread_id, user_id)
     
     # Set query data
     if enhanced_query != query:
@@ -442,6 +615,8 @@ def update_token_data_with_result(
     """
     Update token data dictionary with context and response from agent result.
     
+    Deprecated: use TokenCountingObserver.process_interaction() instead.
+    
     This function extracts the retrieved context from the agent result and adds both
     the context and response to the token_data dictionary. This should be called
     after the agent has been invoked and the response has been extracted.
@@ -464,6 +639,18 @@ def update_token_data_with_result(
         >>> print(token_data['context'])  # Retrieved context from RAG
         >>> print(token_data['response'])  # Agent's response
     """
+    warnings.warn(
+        "update_token_data_with_result() is deprecated; use TokenCountingObserver.process_interaction()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    _add_result(token_data, result, response)
+
+
+def _add_result(token_data: dict, result: Any, response: str) -> None:
+    """Add context and response from the agent result to token data, resolving pending history."""
+    token_data['history'] = _resolve_history(token_data.get('history'))
+    
     # Extract context from result and update token data
     context = extract_context_from_result(result)
     if context:
@@ -483,6 +670,8 @@ def process_token_counting(
     """
     Process token counting for a chat interaction.
     
+    Deprecated: use TokenCountingObserver.process_interaction() instead.
+    
     This is the main function that orchestrates the complete token counting workflow:
     1. Updates token_data with context and response from the agent result
     2. Processes all collected token data through the observer
@@ -531,8 +720,15 @@ def process_token_counting(
         >>> process_token_counting(observer, token_data, result, response, "gpt-4")
         # Logs: Token breakdown with input/output counts and estimated costs
     """
+    warnings.warn(
+        "process_token_counting() is deprecated; use TokenCountingObserver.process_interaction()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    if observer is _NOOP_OBSERVER:
+        return
     # Update token data with context and response from result
-    update_token_data_with_result(token_data, result, response)
+    _add_result(token_data, result, response)
     
     # Process all token data in a single call
     observer.process_all_data(**token_data)
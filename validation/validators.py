@@ -2,7 +2,7 @@
 Pydantic validators for input validation.
 """
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, validator, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..exceptions import ValidationError
 
@@ -15,15 +15,15 @@ class ChatRequest(BaseModel):
     agent_id: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    @validator('message')
-    def validate_message(cls, v):
-        if not v or len(v.strip()) == 0:
-            raise ValueError("Message cannot be empty")
-        return v.strip()
+    model_config = ConfigDict(extra="forbid")
     
-    class Config:
-        """Pydantic configuration."""
-        extra = "forbid"
+    @field_validator('message')
+    @classmethod
+    def validate_message(cls, v: str) -> str:
+        stripped = v.strip()
+        if not stripped:
+            raise ValueError("Message cannot be empty")
+        return stripped
 
 
 class AgentCreateRequest(BaseModel):
@@ -37,9 +37,7 @@ class AgentCreateRequest(BaseModel):
     tools: List[str] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        """Pydantic configuration."""
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class SessionCreateRequest(BaseModel):
@@ -47,9 +45,7 @@ class SessionCreateRequest(BaseModel):
     session_id: Optional[str] = Field(None, max_length=200)
     user_id: Optional[str] = Field(None, max_length=200)
     
-    class Config:
-        """Pydantic configuration."""
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 def validate_chat_request(data: Dict[str, Any]) -> ChatRequest:
@@ -66,6 +62,6 @@ def validate_chat_request(data: Dict[str, Any]) -> ChatRequest:
         ValidationError: If validation fails
     """
     try:
-        return ChatRequest(**data)
+        return ChatRequest.model_validate(data)
     except Exception as e:
         raise ValidationError(f"Invalid chat request: {str(e)}") from e